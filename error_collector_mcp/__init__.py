@@ -5,5 +5,22 @@ This package provides error collection from browser console and terminal,
 AI-powered summarization using OpenRouter, and MCP tools for integration with AI agents.
 """
 
+import asyncio
+
 __version__ = "0.1.0"
-__author__ = "Error Collector MCP Contributors"
\ No newline at end of file
+__author__ = "Error Collector MCP Contributors"
+
+
+def install_fast_loop() -> bool:
+    """Install uvloop as the asyncio event loop policy if it is available.
+    
+    Must be called before the event loop is created (i.e. before ``asyncio.run``).
+    Returns True if uvloop was installed, False if the default loop is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
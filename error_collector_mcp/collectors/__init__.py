@@ -1,10 +1,26 @@
 """Error collectors for different sources."""
 
-from .base_collector import BaseCollector
-from .browser_collector import BrowserConsoleCollector, BrowserErrorData
-from .terminal_collector import TerminalCollector, CommandResult
-from .shell_wrapper import ShellWrapper
-from .browser_extension import BrowserExtensionBuilder
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_collector import BaseCollector
+    from .browser_collector import BrowserConsoleCollector, BrowserErrorData
+    from .terminal_collector import TerminalCollector, CommandResult
+    from .shell_wrapper import ShellWrapper
+    from .browser_extension import BrowserExtensionBuilder
+
+# Exports are imported on first access, so CLI commands that only need the
+# shell wrapper or extension builder don't load aiohttp and the collectors
+_EXPORTS = {
+    "BaseCollector": ".base_collector",
+    "BrowserConsoleCollector": ".browser_collector",
+    "BrowserErrorData": ".browser_collector",
+    "TerminalCollector": ".terminal_collector",
+    "CommandResult": ".terminal_collector",
+    "ShellWrapper": ".shell_wrapper",
+    "BrowserExtensionBuilder": ".browser_extension"
+}
 
 __all__ = [
     "BaseCollector",
@@ -14,4 +30,13 @@ __all__ = [
     "CommandResult",
     "ShellWrapper",
     "BrowserExtensionBuilder"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
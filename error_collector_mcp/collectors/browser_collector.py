@@ -1,12 +1,19 @@
 """Browser console error collector with multiple collection methods."""
 
 import asyncio
+import hashlib
+import inspect
 import json
 import logging
+import re
+import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, Any, Set
+from typing import Deque, List, Dict, Optional, Callable, Any, Set, Tuple
 from dataclasses import dataclass
 import tempfile
 import websockets
@@ -14,124 +21,121 @@ import aiohttp
 from aiohttp import web
 
 from .base_collector import BaseCollector
+from .file_watcher import start_file_watcher
 from ..models import BrowserError, ErrorSeverity
 
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - optional speedup
+    ciso8601 = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
 
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:  # pragma: no cover - exercised only without orjson
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
 
-@dataclass
-class BrowserErrorData:
-    """Raw browser error data before processing."""
-    message: str
-    source: str
-    line_number: Optional[int] = None
-    column_number: Optional[int] = None
-    error_type: str = "Error"
-    stack_trace: Optional[str] = None
-    url: str = ""
-    user_agent: str = ""
-    page_title: str = ""
-    timestamp: Optional[datetime] = None
-    additional_data: Dict[str, Any] = None
+if msgspec is not None:
+    class RawBrowserEvent(msgspec.Struct):
+        """Wire schema of an error report sent by the browser scripts."""
+        message: str = ''
+        source: str = ''
+        line_number: Optional[int] = None
+        column_number: Optional[int] = None
+        error_type: str = 'Error'
+        stack_trace: Optional[str] = None
+        url: str = ''
+        user_agent: str = ''
+        page_title: str = ''
+        timestamp: Optional[str] = None
 
+    # Decodes straight into RawBrowserEvent, skipping the intermediate dict
+    _event_decoder = msgspec.json.Decoder(RawBrowserEvent)
+else:  # pragma: no cover - exercised only without msgspec
+    _event_decoder = None
 
-class BrowserConsoleCollector(BaseCollector):
-    """Collector for browser console errors with multiple collection methods."""
-    
-    def __init__(self, name: str = "browser", port: int = 8765):
-        super().__init__(name)
-        self._collected_errors: List[BrowserError] = []
-        self._error_callbacks: List[Callable[[BrowserError], None]] = []
-        
-        # WebSocket server for real-time collection
-        self._websocket_port = port
-        self._websocket_server = None
-        self._connected_clients: Set[websockets.WebSocketServerProtocol] = set()
-        
-        # HTTP server for bookmarklet/extension communication
-        self._http_port = port + 1
-        self._http_server = None
-        self._http_app = None
-        
-        # File-based collection
-        self._log_file = self._get_log_file()
-        
-        # Error filtering
-        self._ignored_patterns = [
-            r"ResizeObserver loop limit exceeded",
-            r"Non-Error promise rejection captured",
-            r"Script error\.",
-            r"Network request failed.*chrome-extension"
-        ]
-        self._ignored_domains = [
-            "chrome-extension://",
-            "moz-extension://",
-            "safari-extension://"
-        ]
-    
-    async def start_collection(self) -> None:
-        """Start collecting browser console errors."""
-        if self._is_collecting:
-            logger.warning("Browser collector is already running")
-            return
-        
-        self._is_collecting = True
-        
-        # Start WebSocket server
-        await self._start_websocket_server()
-        
-        # Start HTTP server
-        await self._start_http_server()
-        
-        # Start file monitoring
-        asyncio.create_task(self._monitor_log_file())
-        
-        logger.info(f"Browser error collection started on ports {self._websocket_port} (WS) and {self._http_port} (HTTP)")
-        logger.info(f"Log file: {self._log_file}")
-    
-    async def stop_collection(self) -> None:
-        """Stop collecting browser console errors."""
-        if not self._is_collecting:
-            return
-        
-        self._is_collecting = False
-        
-        # Stop WebSocket server
-        if self._websocket_server:
-            self._websocket_server.close()
-            await self._websocket_server.wait_closed()
-            self._websocket_server = None
-        
-        # Stop HTTP server
-        if self._http_server:
-            await self._http_server.cleanup()
-            self._http_server = None
-        
-        logger.info("Browser error collection stopped")
-    
-    async def get_collected_errors(self) -> List[BrowserError]:
-        """Get all collected errors since last retrieval."""
-        errors = self._collected_errors.copy()
-        self._collected_errors.clear()
-        return errors
+if ciso8601 is not None:
+    _parse_timestamp = ciso8601.parse_datetime
+elif sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' from 3.11 on
+    _parse_timestamp = datetime.fromisoformat
+else:  # pragma: no cover - Python < 3.11 without ciso8601
+    def _parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+# (monotonic millisecond, datetime) of the last _now() call
+_ts_cache: List[Any] = [0, None]
+
+
+def _now() -> datetime:
+    """Return datetime.utcnow(), reusing the value within the same millisecond."""
+    now_ms = time.monotonic_ns() // 1_000_000
+    if now_ms != _ts_cache[0] or _ts_cache[1] is None:
+        _ts_cache[0] = now_ms
+        _ts_cache[1] = datetime.utcnow()
+    return _ts_cache[1]
+
+
+# Messages that always mark a browser error as critical, matched against the
+# lowercased message (IGNORECASE is several times slower)
+_CRITICAL_MESSAGE_RE = re.compile(r"out of memory|stack overflow|maximum call stack")
+
+# Severity for the most common error types, checked before the keyword rules
+_TYPE_SEVERITY: Dict[str, ErrorSeverity] = {
+    "consoleerror": ErrorSeverity.MEDIUM,
+    "consolewarning": ErrorSeverity.LOW,
+    "error": ErrorSeverity.HIGH,
+    "typeerror": ErrorSeverity.HIGH,
+    "referenceerror": ErrorSeverity.HIGH,
+    "syntaxerror": ErrorSeverity.HIGH,
+    "rangeerror": ErrorSeverity.HIGH,
+    "unhandledpromiserejection": ErrorSeverity.MEDIUM,
+}
+
+
+@lru_cache(maxsize=256)
+def _classify_error_type(error_type_lower: str) -> ErrorSeverity:
+    """Keyword-based severity for error types not in _TYPE_SEVERITY."""
+    # High severity errors
+    if "error" in error_type_lower or "exception" in error_type_lower:
+        return ErrorSeverity.HIGH
     
-    def add_error_callback(self, callback: Callable[[BrowserError], None]) -> None:
-        """Add a callback to be notified of new errors."""
-        self._error_callbacks.append(callback)
+    # Low severity for warnings
+    if "warning" in error_type_lower:
+        return ErrorSeverity.LOW
     
-    def remove_error_callback(self, callback: Callable[[BrowserError], None]) -> None:
-        """Remove an error callback."""
-        if callback in self._error_callbacks:
-            self._error_callbacks.remove(callback)
-    
-    def get_bookmarklet_code(self) -> str:
-        """Generate bookmarklet code for manual error collection."""
-        bookmarklet_js = f"""
+    return ErrorSeverity.MEDIUM
+
+
+def _minify_js(source: str) -> str:
+    """Collapse a JS snippet onto one line, dropping full-line comments."""
+    return "".join(
+        line.strip() for line in source.splitlines()
+        if line.strip() and not line.strip().startswith("//")
+    )
+
+
+# Bookmarklet source; braces are doubled for str.format and the result is
+# minified once at import.
+_BOOKMARKLET_TEMPLATE = _minify_js("""
 javascript:(function(){{
     const originalConsoleError = console.error;
     const originalConsoleWarn = console.warn;
-    const serverUrl = 'http://localhost:{self._http_port}/collect';
+    const serverUrl = 'http://localhost:{port}/collect';
     
     function sendError(errorData) {{
         fetch(serverUrl, {{
@@ -201,40 +205,15 @@ javascript:(function(){{
     
     alert('Error Collector MCP activated for this page!');
 }})();
-"""
-        return bookmarklet_js.replace('\n', '').replace('    ', '')
-    
-    def get_browser_extension_manifest(self) -> Dict[str, Any]:
-        """Generate browser extension manifest."""
-        return {
-            "manifest_version": 3,
-            "name": "Error Collector MCP",
-            "version": "1.0",
-            "description": "Collect JavaScript errors for AI analysis",
-            "permissions": ["activeTab", "storage"],
-            "host_permissions": ["<all_urls>"],
-            "content_scripts": [{
-                "matches": ["<all_urls>"],
-                "js": ["content.js"],
-                "run_at": "document_start"
-            }],
-            "background": {
-                "service_worker": "background.js"
-            },
-            "action": {
-                "default_popup": "popup.html",
-                "default_title": "Error Collector MCP"
-            }
-        }
-    
-    def get_extension_content_script(self) -> str:
-        """Generate content script for browser extension."""
-        return f"""
+""")
+
+# Content script served to the browser extension.
+_CONTENT_SCRIPT_TEMPLATE = """
 // Error Collector MCP Content Script
 (function() {{
     'use strict';
     
-    const SERVER_URL = 'http://localhost:{self._http_port}/collect';
+    const SERVER_URL = 'http://localhost:{port}/collect';
     let errorCount = 0;
     
     function sendError(errorData) {{
@@ -369,6 +348,224 @@ javascript:(function(){{
     console.log('Error Collector MCP: Active on', window.location.href);
 }})();
 """
+
+
+# dataclass slots are only available from Python 3.10
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class BrowserErrorData:
+    """Raw browser error data before processing."""
+    message: str
+    source: str
+    line_number: Optional[int] = None
+    column_number: Optional[int] = None
+    error_type: str = "Error"
+    stack_trace: Optional[str] = None
+    url: str = ""
+    user_agent: str = ""
+    page_title: str = ""
+    timestamp: Optional[datetime] = None
+    additional_data: Dict[str, Any] = None
+
+
+class BrowserConsoleCollector(BaseCollector):
+    """Collector for browser console errors with multiple collection methods."""
+    
+    def __init__(self, name: str = "browser", port: int = 8765):
+        super().__init__(name)
+        # Bounded so undrained errors cannot grow without limit
+        self._max_collected_errors = 50000
+        self._collected_errors: Deque[BrowserError] = deque(maxlen=self._max_collected_errors)
+        # Immutable snapshot, rebuilt on add/remove, so dispatch never sees a mutation
+        self._error_callbacks: Tuple[Callable[[BrowserError], None], ...] = ()
+        self._callback_tasks: Set[asyncio.Task] = set()
+        self._callback_semaphore: Optional[asyncio.Semaphore] = None
+        self._max_concurrent_callbacks = 64
+        
+        # WebSocket server for real-time collection
+        self._websocket_port = port
+        self._websocket_server = None
+        self._connected_clients: Set[websockets.WebSocketServerProtocol] = set()
+        self._websocket_max_size = 256 * 1024
+        self._broadcast_batch_size = 50
+        
+        # HTTP server for bookmarklet/extension communication
+        self._http_port = port + 1
+        self._http_server = None
+        self._http_app = None
+        # Precomputed (body, content type, ETag) for the static endpoints
+        self._static_responses: Dict[str, Tuple[bytes, str, str]] = {}
+        
+        # File-based collection
+        self._log_file = self._get_log_file()
+        self._log_fp = None
+        self._log_flush_every = 100
+        self._unflushed_writes = 0
+        # File offset up to which our own writes have been flushed; the
+        # monitor skips past it so only other writers' lines are collected
+        self._log_written_offset = 0
+        # Single worker keeps log writes ordered and off the event loop
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Logging and callbacks are batched by a queue consumer while collecting
+        self._error_queue: Optional[asyncio.Queue] = None
+        self._error_queue_task: Optional[asyncio.Task] = None
+        self._max_queue_size = 10000
+        
+        # Set when the log file changes or buffered writes need flushing
+        self._log_changed: Optional[asyncio.Event] = None
+        self._log_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._log_flush_interval = 1.0
+        
+        # Error filtering
+        self._ignored_patterns = [
+            r"ResizeObserver loop limit exceeded",
+            r"Non-Error promise rejection captured",
+            r"Script error\.",
+            r"Network request failed.*chrome-extension"
+        ]
+        self._ignored_domains = [
+            "chrome-extension://",
+            "moz-extension://",
+            "safari-extension://"
+        ]
+        # Single alternation so every pattern is checked in one scan
+        self._ignore_re = re.compile(
+            "|".join(f"(?:{p})" for p in self._ignored_patterns), re.IGNORECASE
+        )
+        self._ignored_domains_tuple = tuple(self._ignored_domains)
+        
+        # Duplicate suppression: hashes of recently seen errors, kept in two
+        # generations that rotate every window (or when one fills up)
+        self._dedup_window = 300.0
+        self._dedup_capacity = 10000
+        self._dedup_current: Set[int] = set()
+        self._dedup_previous: Set[int] = set()
+        self._dedup_rotated_at = time.monotonic()
+        self._duplicates_suppressed = 0
+    
+    async def start_collection(self) -> None:
+        """Start collecting browser console errors."""
+        if self._is_collecting:
+            logger.warning("Browser collector is already running")
+            return
+        
+        self._is_collecting = True
+        
+        # Render the static HTTP payloads once
+        self._build_static_responses()
+        
+        # Keep the log file open for the lifetime of the collector
+        self._open_log_file()
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-log")
+        
+        # Start the error queue consumer
+        self._error_queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._error_queue_task = asyncio.create_task(self._drain_error_queue())
+        
+        # Start WebSocket server
+        await self._start_websocket_server()
+        
+        # Start HTTP server
+        await self._start_http_server()
+        
+        # Start file monitoring
+        self._log_changed = asyncio.Event()
+        asyncio.create_task(self._monitor_log_file())
+        
+        logger.info(f"Browser error collection started on ports {self._websocket_port} (WS) and {self._http_port} (HTTP)")
+        logger.info(f"Log file: {self._log_file}")
+    
+    async def stop_collection(self) -> None:
+        """Stop collecting browser console errors."""
+        if not self._is_collecting:
+            return
+        
+        self._is_collecting = False
+        
+        # Wake the log monitor so it can exit
+        if self._log_changed:
+            self._log_changed.set()
+        if self._log_flush_handle:
+            self._log_flush_handle.cancel()
+            self._log_flush_handle = None
+        
+        # Stop WebSocket server
+        if self._websocket_server:
+            self._websocket_server.close()
+            await self._websocket_server.wait_closed()
+            self._websocket_server = None
+        
+        # Stop HTTP server
+        if self._http_server:
+            await self._http_server.cleanup()
+            self._http_server = None
+        
+        # Let queued errors reach the log and callbacks before shutting down
+        if self._error_queue_task:
+            await self._error_queue.join()
+            self._error_queue_task.cancel()
+            self._error_queue_task = None
+            self._error_queue = None
+        
+        if self._io_executor:
+            await asyncio.get_running_loop().run_in_executor(self._io_executor, self._close_log_file)
+            self._io_executor.shutdown(wait=False)
+            self._io_executor = None
+        else:
+            self._close_log_file()
+        
+        logger.info("Browser error collection stopped")
+    
+    async def get_collected_errors(self) -> List[BrowserError]:
+        """Get all collected errors since last retrieval."""
+        errors = self._collected_errors
+        self._collected_errors = deque(maxlen=self._max_collected_errors)
+        return list(errors)
+    
+    def add_error_callback(self, callback: Callable[[BrowserError], None]) -> None:
+        """Add a callback to be notified of new errors."""
+        self._error_callbacks = self._error_callbacks + (callback,)
+    
+    def remove_error_callback(self, callback: Callable[[BrowserError], None]) -> None:
+        """Remove an error callback."""
+        if callback in self._error_callbacks:
+            callbacks = list(self._error_callbacks)
+            callbacks.remove(callback)
+            self._error_callbacks = tuple(callbacks)
+    
+    def get_bookmarklet_code(self) -> str:
+        """Generate bookmarklet code for manual error collection."""
+        return _BOOKMARKLET_TEMPLATE.format(port=self._http_port)
+    
+    def get_browser_extension_manifest(self) -> Dict[str, Any]:
+        """Generate browser extension manifest."""
+        return {
+            "manifest_version": 3,
+            "name": "Error Collector MCP",
+            "version": "1.0",
+            "description": "Collect JavaScript errors for AI analysis",
+            "permissions": ["activeTab", "storage"],
+            "host_permissions": ["<all_urls>"],
+            "content_scripts": [{
+                "matches": ["<all_urls>"],
+                "js": ["content.js"],
+                "run_at": "document_start"
+            }],
+            "background": {
+                "service_worker": "background.js"
+            },
+            "action": {
+                "default_popup": "popup.html",
+                "default_title": "Error Collector MCP"
+            }
+        }
+    
+    def get_extension_content_script(self) -> str:
+        """Generate content script for browser extension."""
+        return _CONTENT_SCRIPT_TEMPLATE.format(port=self._http_port)
     
     async def health_check(self) -> bool:
         """Check if the browser collector is healthy."""
@@ -394,7 +591,10 @@ javascript:(function(){{
             self._websocket_server = await websockets.serve(
                 self._handle_websocket_connection,
                 "localhost",
-                self._websocket_port
+                self._websocket_port,
+                # Error payloads are small; deflate costs more than it saves
+                compression=None,
+                max_size=self._websocket_max_size
             )
             logger.info(f"WebSocket server started on port {self._websocket_port}")
         except Exception as e:
@@ -435,9 +635,9 @@ javascript:(function(){{
         try:
             async for message in websocket:
                 try:
-                    error_data = json.loads(message)
-                    await self._process_browser_error_data(error_data)
-                except json.JSONDecodeError:
+                    # Parse the frame as delivered (str or bytes), no re-encoding
+                    await self._process_raw_error(message)
+                except ValueError:
                     logger.warning(f"Invalid JSON received: {message}")
                 except Exception as e:
                     logger.error(f"Error processing WebSocket message: {e}")
@@ -449,33 +649,56 @@ javascript:(function(){{
     async def _handle_http_error(self, request):
         """Handle HTTP POST requests with error data."""
         try:
-            error_data = await request.json()
-            await self._process_browser_error_data(error_data)
-            return web.json_response({"status": "success"})
+            await self._process_raw_error(await request.read())
+            return self._json_response({"status": "success"})
         except Exception as e:
             logger.error(f"Error processing HTTP error data: {e}")
-            return web.json_response({"status": "error", "message": str(e)}, status=400)
+            return self._json_response({"status": "error", "message": str(e)}, status=400)
     
-    async def _serve_bookmarklet(self, request):
-        """Serve bookmarklet code."""
-        bookmarklet = self.get_bookmarklet_code()
+    @staticmethod
+    def _json_response(data: Any, status: int = 200) -> web.Response:
+        """Build a JSON response using the fastest available encoder."""
+        return web.Response(body=_json_dumps(data), status=status, content_type="application/json")
+    
+    def _build_static_responses(self) -> None:
+        """Render the bookmarklet, manifest and content script payloads."""
+        payloads = {
+            "bookmarklet": (f"javascript:{self.get_bookmarklet_code()}".encode('utf-8'), "text/plain"),
+            "manifest": (_json_dumps(self.get_browser_extension_manifest()), "application/json"),
+            "content": (self.get_extension_content_script().encode('utf-8'), "application/javascript"),
+        }
+        self._static_responses = {
+            key: (body, content_type, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+            for key, (body, content_type) in payloads.items()
+        }
+    
+    def _serve_static(self, request, key: str) -> web.Response:
+        """Serve a precomputed payload, answering 304 when the ETag matches."""
+        if not self._static_responses:
+            self._build_static_responses()
+        
+        body, content_type, etag = self._static_responses[key]
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        
         return web.Response(
-            text=f"javascript:{bookmarklet}",
-            content_type="text/plain"
+            body=body,
+            content_type=content_type,
+            charset="utf-8",
+            headers={"ETag": etag}
         )
     
+    async def _serve_bookmarklet(self, request):
+        """Serve bookmarklet code."""
+        return self._serve_static(request, "bookmarklet")
+    
     async def _serve_extension_manifest(self, request):
         """Serve browser extension manifest."""
-        manifest = self.get_browser_extension_manifest()
-        return web.json_response(manifest)
+        return self._serve_static(request, "manifest")
     
     async def _serve_extension_content(self, request):
         """Serve browser extension content script."""
-        content_script = self.get_extension_content_script()
-        return web.Response(
-            text=content_script,
-            content_type="application/javascript"
-        )
+        return self._serve_static(request, "content")
     
     async def _serve_status(self, request):
         """Serve collector status."""
@@ -485,9 +708,10 @@ javascript:(function(){{
             "http_port": self._http_port,
             "connected_clients": len(self._connected_clients),
             "errors_collected": len(self._collected_errors),
+            "duplicates_suppressed": self._duplicates_suppressed,
             "log_file": str(self._log_file)
         }
-        return web.json_response(status)
+        return self._json_response(status)
     
     @web.middleware
     async def _cors_middleware(self, request, handler):
@@ -503,40 +727,83 @@ javascript:(function(){{
         
         return response
     
+    async def _process_raw_error(self, raw: Any) -> None:
+        """Decode a JSON error payload (str or bytes) and process it.
+        
+        Raises ValueError if the payload is not valid JSON.
+        """
+        if _event_decoder is not None:
+            try:
+                event = _event_decoder.decode(raw)
+            except msgspec.ValidationError:
+                # Valid JSON that doesn't match the schema; use the lenient path
+                pass
+            except msgspec.DecodeError as e:
+                raise ValueError(f"Invalid JSON: {e}") from e
+            else:
+                await self._process_error_fields(
+                    event.message, event.source, event.line_number, event.column_number,
+                    event.url, event.error_type, event.stack_trace,
+                    event.user_agent, event.page_title, event.timestamp
+                )
+                return
+        
+        await self._process_browser_error_data(_json_loads(raw))
+    
     async def _process_browser_error_data(self, error_data: Dict[str, Any]) -> None:
         """Process raw browser error data and create BrowserError."""
         try:
-            # Convert to BrowserErrorData first
-            browser_error_data = BrowserErrorData(
-                message=error_data.get('message', ''),
-                source=error_data.get('source', ''),
-                line_number=error_data.get('line_number'),
-                column_number=error_data.get('column_number'),
-                error_type=error_data.get('error_type', 'Error'),
-                stack_trace=error_data.get('stack_trace'),
-                url=error_data.get('url', ''),
-                user_agent=error_data.get('user_agent', ''),
-                page_title=error_data.get('page_title', ''),
-                timestamp=datetime.fromisoformat(error_data['timestamp'].replace('Z', '+00:00')) if error_data.get('timestamp') else datetime.utcnow(),
-                additional_data=error_data.get('additional_data', {})
+            await self._process_error_fields(
+                error_data.get('message', ''),
+                error_data.get('source', ''),
+                error_data.get('line_number'),
+                error_data.get('column_number'),
+                error_data.get('url', ''),
+                error_data.get('error_type', 'Error'),
+                error_data.get('stack_trace'),
+                error_data.get('user_agent', ''),
+                error_data.get('page_title', ''),
+                error_data.get('timestamp')
             )
+        except Exception as e:
+            logger.error(f"Failed to process browser error data: {e}")
+    
+    async def _process_error_fields(
+        self,
+        message: str,
+        source: Optional[str],
+        line_number: Optional[int],
+        column_number: Optional[int],
+        url: str,
+        error_type: str,
+        stack_trace: Optional[str],
+        user_agent: str,
+        page_title: str,
+        timestamp: Optional[str]
+    ) -> None:
+        """Filter a decoded browser error and create BrowserError."""
+        try:
+            # Drop repeats of an error seen within the dedup window
+            if self._is_duplicate(message, source, line_number, column_number):
+                self._duplicates_suppressed += 1
+                return
             
             # Check if error should be ignored
-            if self._should_ignore_error(browser_error_data):
+            if self._is_ignored(message, url, source):
                 return
             
             # Create BrowserError
             browser_error = BrowserError(
-                message=browser_error_data.message,
-                url=browser_error_data.url,
-                user_agent=browser_error_data.user_agent,
-                page_title=browser_error_data.page_title,
-                line_number=browser_error_data.line_number,
-                column_number=browser_error_data.column_number,
-                error_type=browser_error_data.error_type,
-                stack_trace=browser_error_data.stack_trace,
-                timestamp=browser_error_data.timestamp,
-                severity=self._determine_error_severity(browser_error_data)
+                message=message,
+                url=url,
+                user_agent=user_agent,
+                page_title=page_title,
+                line_number=line_number,
+                column_number=column_number,
+                error_type=error_type,
+                stack_trace=stack_trace,
+                timestamp=_parse_timestamp(timestamp) if timestamp else _now(),
+                severity=self._severity_for(message, error_type)
             )
             
             # Collect the error
@@ -545,73 +812,195 @@ javascript:(function(){{
         except Exception as e:
             logger.error(f"Failed to process browser error data: {e}")
     
+    def _is_duplicate(self, message: str, source: str, line_number: Any, column_number: Any) -> bool:
+        """Check and record an error key in the sliding dedup window."""
+        now = time.monotonic()
+        if (now - self._dedup_rotated_at >= self._dedup_window
+                or len(self._dedup_current) >= self._dedup_capacity):
+            self._dedup_previous = self._dedup_current
+            self._dedup_current = set()
+            self._dedup_rotated_at = now
+        
+        key = hash((message, source, line_number, column_number))
+        if key in self._dedup_current or key in self._dedup_previous:
+            return True
+        
+        self._dedup_current.add(key)
+        return False
+    
     def _should_ignore_error(self, error_data: BrowserErrorData) -> bool:
         """Check if error should be ignored based on patterns and domains."""
-        import re
-        
+        return self._is_ignored(error_data.message, error_data.url, error_data.source)
+    
+    def _is_ignored(self, message: str, url: str, source: str) -> bool:
+        """Check raw message/url/source values against ignored patterns and domains."""
         # Check ignored patterns
-        for pattern in self._ignored_patterns:
-            if re.search(pattern, error_data.message, re.IGNORECASE):
-                return True
+        if self._ignore_re.search(message):
+            return True
         
         # Check ignored domains
-        for domain in self._ignored_domains:
-            if domain in error_data.url or domain in error_data.source:
-                return True
-        
-        return False
+        return any(domain in url or domain in source for domain in self._ignored_domains_tuple)
     
     def _determine_error_severity(self, error_data: BrowserErrorData) -> ErrorSeverity:
         """Determine error severity based on error data."""
-        message_lower = error_data.message.lower()
-        error_type_lower = error_data.error_type.lower()
-        
+        return self._severity_for(error_data.message, error_data.error_type)
+    
+    def _severity_for(self, message: str, error_type: str) -> ErrorSeverity:
+        """Determine error severity from the raw message and error type."""
         # Critical errors
-        if any(keyword in message_lower for keyword in [
-            "out of memory", "stack overflow", "maximum call stack"
-        ]):
+        if _CRITICAL_MESSAGE_RE.search(message.lower()):
             return ErrorSeverity.CRITICAL
         
-        # High severity errors
-        if any(keyword in error_type_lower for keyword in [
-            "error", "exception"
-        ]) and error_type_lower not in ["consoleerror", "consolewarning"]:
-            return ErrorSeverity.HIGH
-        
-        # Medium severity for console errors
-        if "consoleerror" in error_type_lower:
-            return ErrorSeverity.MEDIUM
-        
-        # Low severity for warnings
-        if any(keyword in error_type_lower for keyword in [
-            "warning", "consolewarning"
-        ]):
-            return ErrorSeverity.LOW
-        
-        return ErrorSeverity.MEDIUM
+        error_type_lower = error_type.lower()
+        severity = _TYPE_SEVERITY.get(error_type_lower)
+        if severity is None:
+            severity = _classify_error_type(error_type_lower)
+        return severity
     
     async def _collect_error(self, error: BrowserError) -> None:
         """Collect a browser error."""
         self._collected_errors.append(error)
         
+        # Hand logging and callbacks to the queue consumer when it is running
+        if self._error_queue is not None:
+            try:
+                self._error_queue.put_nowait(error)
+                return
+            except asyncio.QueueFull:
+                logger.warning("Browser error queue is full, processing error inline")
+        
+        self._dispatch_errors([error])
+    
+    async def _drain_error_queue(self) -> None:
+        """Consume queued errors in batches."""
+        queue = self._error_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                encoded = self._dispatch_errors(batch)
+                if encoded and self._connected_clients:
+                    # One JSON array per batch, shared by every client
+                    payload = (b'[' + b','.join(encoded) + b']').decode('utf-8')
+                    await self._broadcast(payload)
+            except Exception as e:
+                logger.error(f"Error dispatching browser errors: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _broadcast(self, payload: str) -> None:
+        """Send a pre-serialized payload to all connected WebSocket clients."""
+        clients = list(self._connected_clients)
+        batch_size = self._broadcast_batch_size
+        for i in range(0, len(clients), batch_size):
+            await asyncio.gather(
+                *(client.send(payload) for client in clients[i:i + batch_size]),
+                return_exceptions=True
+            )
+            # Let receive handlers run between batches
+            await asyncio.sleep(0)
+    
+    def _dispatch_errors(self, errors: List[BrowserError]) -> Optional[List[bytes]]:
+        """Log a batch of errors to file and notify callbacks.
+        
+        Returns the JSON-encoded errors, or None if they could not be serialized.
+        """
         # Log to file
-        self._log_error_to_file(error)
+        try:
+            encoded = [_json_dumps(error.to_dict()) for error in errors]
+        except Exception as e:
+            logger.error(f"Failed to log error to file: {e}")
+            encoded = None
+        else:
+            self._log_errors_to_file(encoded)
+        
+        # Notify callbacks on later loop iterations so a slow callback
+        # does not hold up the batch
+        callbacks = self._error_callbacks
+        loop = asyncio.get_running_loop()
+        for error in errors:
+            for callback in callbacks:
+                loop.call_soon(self._run_callback, callback, error)
+            
+            logger.debug(f"Collected browser error: {error.message[:100]}...")
+        
+        return encoded
+    
+    def _run_callback(self, callback: Callable[[BrowserError], Any], error: BrowserError) -> None:
+        """Invoke a callback, scheduling it as a task if it returns an awaitable."""
+        try:
+            result = callback(error)
+        except Exception as e:
+            logger.error(f"Error in error callback: {e}")
+            return
+        
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(self._await_callback(result))
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._callback_tasks.discard)
+    
+    async def _await_callback(self, awaitable) -> None:
+        """Await an async callback, bounding how many run at once."""
+        if self._callback_semaphore is None:
+            self._callback_semaphore = asyncio.Semaphore(self._max_concurrent_callbacks)
         
-        # Notify callbacks
-        for callback in self._error_callbacks:
+        async with self._callback_semaphore:
             try:
-                callback(error)
+                await awaitable
             except Exception as e:
                 logger.error(f"Error in error callback: {e}")
-        
-        logger.debug(f"Collected browser error: {error.message[:100]}...")
     
-    def _log_error_to_file(self, error: BrowserError) -> None:
-        """Log error to file for persistence."""
+    def _open_log_file(self) -> None:
+        """Open the persistent append handle for the log file."""
+        if self._log_fp is None:
+            self._log_fp = open(self._log_file, 'ab', buffering=64 * 1024)
+            self._unflushed_writes = 0
+    
+    def _flush_log_file(self) -> None:
+        """Flush buffered log writes to disk."""
+        if self._log_fp is not None and self._unflushed_writes:
+            self._log_fp.flush()
+            self._unflushed_writes = 0
+            # Appends leave the position at the end of what we just wrote
+            self._log_written_offset = self._log_fp.tell()
+    
+    def _close_log_file(self) -> None:
+        """Flush and close the persistent log handle."""
+        if self._log_fp is not None:
+            try:
+                self._log_fp.close()
+            except Exception as e:
+                logger.error(f"Failed to close log file: {e}")
+            self._log_fp = None
+            self._unflushed_writes = 0
+    
+    def _log_errors_to_file(self, encoded: List[bytes]) -> None:
+        """Log JSON-encoded errors to file for persistence."""
+        data = b'\n'.join(encoded) + b'\n'
+        if self._io_executor:
+            self._io_executor.submit(self._write_log_lines, data, len(encoded))
+            self._schedule_log_flush()
+        else:
+            self._write_log_lines(data, len(encoded))
+    
+    def _schedule_log_flush(self) -> None:
+        """Wake the log monitor to flush buffered writes after a short delay."""
+        if self._log_flush_handle is None and self._log_changed is not None:
+            self._log_flush_handle = asyncio.get_running_loop().call_later(
+                self._log_flush_interval, self._log_changed.set
+            )
+    
+    def _write_log_lines(self, data: bytes, count: int) -> None:
+        """Append serialized error lines to the log file (runs on the I/O worker)."""
         try:
-            with open(self._log_file, 'a', encoding='utf-8') as f:
-                json.dump(error.to_dict(), f)
-                f.write('\n')
+            self._open_log_file()
+            self._log_fp.write(data)
+            self._unflushed_writes += count
+            if self._unflushed_writes >= self._log_flush_every:
+                self._flush_log_file()
         except Exception as e:
             logger.error(f"Failed to log error to file: {e}")
     
@@ -621,30 +1010,53 @@ javascript:(function(){{
             self._log_file.touch()
         
         last_size = self._log_file.stat().st_size
+        changed = self._log_changed
+        observer = start_file_watcher(self._log_file, changed)
         
-        while self._is_collecting:
-            try:
-                current_size = self._log_file.stat().st_size
-                
-                if current_size > last_size:
-                    # Read new content
-                    with open(self._log_file, 'r', encoding='utf-8') as f:
-                        f.seek(last_size)
-                        new_content = f.read()
+        try:
+            while self._is_collecting:
+                try:
+                    # Push buffered writes out
+                    if self._log_flush_handle:
+                        self._log_flush_handle.cancel()
+                        self._log_flush_handle = None
+                    if self._io_executor:
+                        await asyncio.get_running_loop().run_in_executor(
+                            self._io_executor, self._flush_log_file
+                        )
+                    else:
+                        self._flush_log_file()
                     
-                    # Process new log entries
-                    for line in new_content.strip().split('\n'):
-                        if line.strip():
-                            try:
-                                error_data = json.loads(line)
-                                await self._process_browser_error_data(error_data)
-                            except json.JSONDecodeError:
-                                continue
+                    current_size = self._log_file.stat().st_size
+                    # Don't read back lines this collector wrote itself
+                    last_size = max(last_size, self._log_written_offset)
                     
-                    last_size = current_size
-                
-                await asyncio.sleep(1)  # Check every second
-                
-            except Exception as e:
-                logger.error(f"Error monitoring log file: {e}")
-                await asyncio.sleep(5)
\ No newline at end of file
+                    if current_size > last_size:
+                        # Stream new entries one line at a time
+                        with open(self._log_file, 'rb') as f:
+                            f.seek(last_size)
+                            for raw in f:
+                                # Leave a partially written line for the next pass
+                                if not raw.endswith(b'\n'):
+                                    break
+                                last_size += len(raw)
+                                
+                                if raw.strip():
+                                    try:
+                                        await self._process_raw_error(raw)
+                                    except ValueError:
+                                        continue
+                    
+                    # Sleep until the file changes (or poll every second without a watcher)
+                    if observer is None:
+                        await asyncio.sleep(1)
+                    else:
+                        await changed.wait()
+                        changed.clear()
+                    
+                except Exception as e:
+                    logger.error(f"Error monitoring log file: {e}")
+                    await asyncio.sleep(5)
+        finally:
+            if observer is not None:
+                observer.stop()
@@ -1,266 +1,129 @@
 """Browser extension builder and utilities."""
 
 import json
+import os
+import re
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Tuple, Union
 import tempfile
 
+try:
+    import libarchive
+except (ImportError, OSError):  # pragma: no cover - optional speedup, needs the libarchive C library
+    libarchive = None
 
-class BrowserExtensionBuilder:
-    """Builder for browser extension files."""
-    
-    def __init__(self, collector_port: int = 8766):
-        self.collector_port = collector_port
-    
-    def build_chrome_extension(self, output_dir: Path) -> Path:
-        """Build Chrome extension files."""
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create manifest.json
-        manifest = self._get_manifest_v3()
-        with open(output_dir / "manifest.json", 'w') as f:
-            json.dump(manifest, f, indent=2)
-        
-        # Create content script
-        with open(output_dir / "content.js", 'w') as f:
-            f.write(self._get_content_script())
-        
-        # Create background script
-        with open(output_dir / "background.js", 'w') as f:
-            f.write(self._get_background_script())
-        
-        # Create popup HTML
-        with open(output_dir / "popup.html", 'w') as f:
-            f.write(self._get_popup_html())
-        
-        # Create popup script
-        with open(output_dir / "popup.js", 'w') as f:
-            f.write(self._get_popup_script())
-        
-        # Create icons directory and placeholder icon
-        icons_dir = output_dir / "icons"
-        icons_dir.mkdir(exist_ok=True)
-        
-        # Create a simple SVG icon
-        icon_svg = '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 48 48">
+try:
+    from rjsmin import jsmin
+except ImportError:  # pragma: no cover - optional, scripts are shipped unminified
+    jsmin = None
+
+try:
+    from rcssmin import cssmin
+except ImportError:  # pragma: no cover - optional, styles are shipped unminified
+    cssmin = None
+
+_PLACEHOLDER_RE = re.compile(r'__(API|SERVER_URL)__')
+_STYLE_RE = re.compile(r'(<style>)(.*?)(</style>)', re.DOTALL)
+_INDENT_RE = re.compile(r'\n[ \t]+')
+
+
+def _render(template: str, **values: str) -> str:
+    """Fill __NAME__ placeholders in a single pass from lower-cased keyword values."""
+    return _PLACEHOLDER_RE.sub(lambda m: values[m.group(1).lower()], template)
+
+
+def _minify_js(source: str) -> str:
+    """Minify a script with rjsmin when it is installed."""
+    return jsmin(source) if jsmin is not None else source
+
+
+def _minify_html(source: str) -> str:
+    """Minify inline CSS with rcssmin when installed and drop line indentation."""
+    if cssmin is not None:
+        source = _STYLE_RE.sub(lambda m: m.group(1) + cssmin(m.group(2)) + m.group(3), source)
+    return _INDENT_RE.sub('\n', source)
+
+
+# Placeholder icon written into every extension root
+_ICON_SVG = '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 48 48">
             <circle cx="24" cy="24" r="20" fill="#ff6b6b" stroke="#fff" stroke-width="2"/>
             <text x="24" y="30" text-anchor="middle" fill="white" font-family="Arial" font-size="16" font-weight="bold">!</text>
         </svg>'''
-        
-        with open(icons_dir / "icon.svg", 'w') as f:
-            f.write(icon_svg)
-        
-        return output_dir
-    
-    def build_firefox_extension(self, output_dir: Path) -> Path:
-        """Build Firefox extension files."""
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create manifest.json (v2 for Firefox)
-        manifest = self._get_manifest_v2()
-        with open(output_dir / "manifest.json", 'w') as f:
-            json.dump(manifest, f, indent=2)
-        
-        # Create content script (same as Chrome)
-        with open(output_dir / "content.js", 'w') as f:
-            f.write(self._get_content_script_firefox())
-        
-        # Create background script (v2 format)
-        with open(output_dir / "background.js", 'w') as f:
-            f.write(self._get_background_script_firefox())
-        
-        # Create popup files (same as Chrome)
-        with open(output_dir / "popup.html", 'w') as f:
-            f.write(self._get_popup_html())
-        
-        with open(output_dir / "popup.js", 'w') as f:
-            f.write(self._get_popup_script_firefox())
-        
-        return output_dir
-    
-    def create_extension_package(self, extension_dir: Path, output_file: Path) -> Path:
-        """Create a packaged extension file."""
-        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for file_path in extension_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(extension_dir)
-                    zf.write(file_path, arcname)
-        
-        return output_file
-    
-    def _get_manifest_v3(self) -> Dict[str, Any]:
-        """Get Chrome extension manifest v3."""
-        return {
-            "manifest_version": 3,
-            "name": "Error Collector MCP",
-            "version": "1.0.0",
-            "description": "Collect JavaScript errors for AI analysis with Kiro",
-            "permissions": [
-                "activeTab",
-                "storage"
-            ],
-            "host_permissions": [
-                "<all_urls>"
-            ],
-            "content_scripts": [{
-                "matches": ["<all_urls>"],
-                "js": ["content.js"],
-                "run_at": "document_start",
-                "all_frames": True
-            }],
-            "background": {
-                "service_worker": "background.js"
-            },
-            "action": {
-                "default_popup": "popup.html",
-                "default_title": "Error Collector MCP",
-                "default_icon": {
-                    "16": "icons/icon.svg",
-                    "32": "icons/icon.svg",
-                    "48": "icons/icon.svg",
-                    "128": "icons/icon.svg"
-                }
-            },
-            "icons": {
-                "16": "icons/icon.svg",
-                "32": "icons/icon.svg",
-                "48": "icons/icon.svg",
-                "128": "icons/icon.svg"
-            }
-        }
-    
-    def _get_manifest_v2(self) -> Dict[str, Any]:
-        """Get Firefox extension manifest v2."""
-        return {
-            "manifest_version": 2,
-            "name": "Error Collector MCP",
-            "version": "1.0.0",
-            "description": "Collect JavaScript errors for AI analysis with Kiro",
-            "permissions": [
-                "activeTab",
-                "storage",
-                "<all_urls>"
-            ],
-            "content_scripts": [{
-                "matches": ["<all_urls>"],
-                "js": ["content.js"],
-                "run_at": "document_start",
-                "all_frames": True
-            }],
-            "background": {
-                "scripts": ["background.js"],
-                "persistent": False
-            },
-            "browser_action": {
-                "default_popup": "popup.html",
-                "default_title": "Error Collector MCP",
-                "default_icon": {
-                    "16": "icons/icon.svg",
-                    "32": "icons/icon.svg",
-                    "48": "icons/icon.svg",
-                    "128": "icons/icon.svg"
-                }
-            },
-            "icons": {
-                "16": "icons/icon.svg",
-                "32": "icons/icon.svg",
-                "48": "icons/icon.svg",
-                "128": "icons/icon.svg"
-            }
-        }
-    
-    def _get_content_script(self) -> str:
-        """Get content script for Chrome."""
-        return f'''
+
+# Scripts and popup are minified once at import. In the script templates
+# __API__ is the extension API namespace (chrome or browser) and
+# __SERVER_URL__ the collector endpoint.
+_CONTENT_SCRIPT_TEMPLATE = _minify_js('''
 // Error Collector MCP - Chrome Content Script
-(function() {{
+(function() {
     'use strict';
     
-    const SERVER_URL = 'http://localhost:{self.collector_port}/collect';
+    const SERVER_URL = '__SERVER_URL__';
     let errorCount = 0;
     let isEnabled = true;
     
     // Check if collection is enabled
-    chrome.storage.sync.get(['errorCollectionEnabled'], function(result) {{
+    __API__.storage.sync.get(['errorCollectionEnabled'], function(result) {
         isEnabled = result.errorCollectionEnabled !== false;
-    }});
+    });
     
     // Listen for enable/disable messages
-    chrome.runtime.onMessage.addListener(function(request, sender, sendResponse) {{
-        if (request.type === 'TOGGLE_COLLECTION') {{
+    __API__.runtime.onMessage.addListener(function(request, sender, sendResponse) {
+        if (request.type === 'TOGGLE_COLLECTION') {
             isEnabled = request.enabled;
-            sendResponse({{success: true}});
-        }}
-    }});
+            sendResponse({success: true});
+        }
+    });
     
-    function sendError(errorData) {{
+    function sendError(errorData) {
         if (!isEnabled) return;
         
         // Add page context
-        errorData.page_context = {{
+        errorData.page_context = {
             referrer: document.referrer,
-            viewport: {{
+            viewport: {
                 width: window.innerWidth,
                 height: window.innerHeight
-            }},
-            scroll: {{
+            },
+            scroll: {
                 x: window.scrollX,
                 y: window.scrollY
-            }}
-        }};
+            }
+        };
         
         // Send to background script
-        chrome.runtime.sendMessage({{
+        __API__.runtime.sendMessage({
             type: 'ERROR_COLLECTED',
             data: errorData
-        }});
+        });
         
         // Try direct HTTP send
-        fetch(SERVER_URL, {{
+        fetch(SERVER_URL, {
             method: 'POST',
-            headers: {{'Content-Type': 'application/json'}},
+            headers: {'Content-Type': 'application/json'},
             body: JSON.stringify(errorData),
             mode: 'cors'
-        }}).catch(e => console.debug('Direct send failed:', e));
-    }}
-    
-    function shouldIgnoreError(message, source) {{
-        const ignoredPatterns = [
-            /ResizeObserver loop limit exceeded/,
-            /Non-Error promise rejection captured/,
-            /Script error\\./,
-            /Network request failed.*chrome-extension/,
-            /Loading chunk \\d+ failed/,
-            /ChunkLoadError/
-        ];
-        
-        const ignoredDomains = [
-            'chrome-extension://',
-            'moz-extension://',
-            'safari-extension://',
-            'chrome-devtools://'
-        ];
-        
-        // Check patterns
-        for (const pattern of ignoredPatterns) {{
-            if (pattern.test(message)) return true;
-        }}
-        
-        // Check domains
-        for (const domain of ignoredDomains) {{
-            if (source && source.includes(domain)) return true;
-        }}
-        
-        return false;
-    }}
+        }).catch(e => console.debug('Direct send failed:', e));
+    }
+    
+    // Single alternations so each check is one regex pass
+    const IGNORED_PATTERNS = /ResizeObserver loop limit exceeded|Non-Error promise rejection captured|Script error\\.|Network request failed.*chrome-extension|Loading chunk \\d+ failed|ChunkLoadError/;
+    const IGNORED_DOMAINS = /chrome-extension:\\/\\/|moz-extension:\\/\\/|safari-extension:\\/\\/|chrome-devtools:\\/\\//;
+    
+    function shouldIgnoreError(message, source) {
+        if (IGNORED_PATTERNS.test(message)) return true;
+        return Boolean(source) && IGNORED_DOMAINS.test(source);
+    }
     
     // Capture JavaScript errors
-    window.addEventListener('error', function(event) {{
+    window.addEventListener('error', function(event) {
         if (shouldIgnoreError(event.message, event.filename)) return;
         
         errorCount++;
-        sendError({{
+        sendError({
             message: event.message,
             source: event.filename || 'unknown',
             line_number: event.lineno,
@@ -271,18 +134,18 @@ class BrowserExtensionBuilder:
             user_agent: navigator.userAgent,
             page_title: document.title,
             timestamp: new Date().toISOString(),
-            error_id: `error_${{Date.now()}}_${{errorCount}}`,
+            error_id: `error_${Date.now()}_${errorCount}`,
             collection_method: 'extension'
-        }});
-    }}, true);
+        });
+    }, true);
     
     // Capture unhandled promise rejections
-    window.addEventListener('unhandledrejection', function(event) {{
+    window.addEventListener('unhandledrejection', function(event) {
         const message = event.reason ? event.reason.toString() : 'Unhandled Promise Rejection';
         if (shouldIgnoreError(message, '')) return;
         
         errorCount++;
-        sendError({{
+        sendError({
             message: message,
             source: 'promise',
             error_type: 'UnhandledPromiseRejection',
@@ -291,136 +154,153 @@ class BrowserExtensionBuilder:
             user_agent: navigator.userAgent,
             page_title: document.title,
             timestamp: new Date().toISOString(),
-            error_id: `promise_${{Date.now()}}_${{errorCount}}`,
+            error_id: `promise_${Date.now()}_${errorCount}`,
             collection_method: 'extension'
-        }});
-    }});
+        });
+    });
     
     // Override console methods
     const originalError = console.error;
     const originalWarn = console.warn;
     
-    console.error = function(...args) {{
-        originalError.apply(console, args);
+    function stringifyArg(arg) {
+        if (typeof arg !== 'object') return String(arg);
+        try {
+            return JSON.stringify(arg);
+        } catch (e) {
+            // Circular structures and the like
+            return String(arg);
+        }
+    }
+    
+    function reportConsoleMessage(args, source, errorType, idPrefix) {
         if (!isEnabled) return;
         
-        const message = args.map(arg => 
-            typeof arg === 'object' ? JSON.stringify(arg) : String(arg)
-        ).join(' ');
-        
-        if (!shouldIgnoreError(message, '')) {{
-            errorCount++;
-            sendError({{
-                message: message,
-                source: 'console.error',
-                error_type: 'ConsoleError',
-                url: window.location.href,
-                user_agent: navigator.userAgent,
-                page_title: document.title,
-                timestamp: new Date().toISOString(),
-                error_id: `console_error_${{Date.now()}}_${{errorCount}}`,
-                collection_method: 'extension'
-            }});
-        }}
-    }};
-    
-    console.warn = function(...args) {{
-        originalWarn.apply(console, args);
-        if (!isEnabled) return;
+        // Cheap check on the first argument before stringifying objects
+        if (shouldIgnoreError(String(args[0]), '')) return;
         
-        const message = args.map(arg => 
-            typeof arg === 'object' ? JSON.stringify(arg) : String(arg)
-        ).join(' ');
-        
-        if (!shouldIgnoreError(message, '')) {{
-            errorCount++;
-            sendError({{
-                message: message,
-                source: 'console.warn',
-                error_type: 'ConsoleWarning',
-                url: window.location.href,
-                user_agent: navigator.userAgent,
-                page_title: document.title,
-                timestamp: new Date().toISOString(),
-                error_id: `console_warn_${{Date.now()}}_${{errorCount}}`,
-                collection_method: 'extension'
-            }});
-        }}
-    }};
+        const message = args.map(stringifyArg).join(' ');
+        if (shouldIgnoreError(message, '')) return;
+        
+        errorCount++;
+        sendError({
+            message: message,
+            source: source,
+            error_type: errorType,
+            url: window.location.href,
+            user_agent: navigator.userAgent,
+            page_title: document.title,
+            timestamp: new Date().toISOString(),
+            error_id: `${idPrefix}_${Date.now()}_${errorCount}`,
+            collection_method: 'extension'
+        });
+    }
     
-    // Notify that extension is active
-    if (isEnabled) {{
-        console.log('Error Collector MCP: Extension active on', window.location.href);
-    }}
-}})();
-'''
+    console.error = function(...args) {
+        originalError.apply(console, args);
+        reportConsoleMessage(args, 'console.error', 'ConsoleError', 'console_error');
+    };
     
-    def _get_content_script_firefox(self) -> str:
-        """Get content script for Firefox (similar to Chrome but with browser API)."""
-        return self._get_content_script().replace('chrome.', 'browser.')
+    console.warn = function(...args) {
+        originalWarn.apply(console, args);
+        reportConsoleMessage(args, 'console.warn', 'ConsoleWarning', 'console_warn');
+    };
     
-    def _get_background_script(self) -> str:
-        """Get background script for Chrome."""
-        return f'''
+    // Notify that extension is active
+    if (isEnabled) {
+        console.log('Error Collector MCP: Extension active on', window.location.href);
+    }
+})();
+''')
+
+_BACKGROUND_SCRIPT_TEMPLATE = _minify_js('''
 // Error Collector MCP - Chrome Background Script
-chrome.runtime.onMessage.addListener(function(request, sender, sendResponse) {{
-    if (request.type === 'ERROR_COLLECTED') {{
-        // Store error in local storage for popup display
-        chrome.storage.local.get(['recentErrors'], function(result) {{
-            const recentErrors = result.recentErrors || [];
-            recentErrors.unshift({{
-                ...request.data,
-                tab_id: sender.tab.id,
-                tab_url: sender.tab.url
-            }});
-            
-            // Keep only last 100 errors
-            if (recentErrors.length > 100) {{
-                recentErrors.splice(100);
-            }}
-            
-            chrome.storage.local.set({{recentErrors: recentErrors}});
-        }});
+const MAX_RECENT_ERRORS = 100;
+const FLUSH_DELAY_MS = 250;
+
+// Ring buffer of errors received since the last flush
+const pendingRing = new Array(MAX_RECENT_ERRORS);
+let pendingHead = 0;
+let pendingCount = 0;
+let flushTimer = null;
+
+// Drain the ring buffer, newest first
+function takePendingErrors() {
+    const size = Math.min(pendingCount, MAX_RECENT_ERRORS);
+    const errors = new Array(size);
+    for (let i = 0; i < size; i++) {
+        const index = (pendingHead - 1 - i + MAX_RECENT_ERRORS) % MAX_RECENT_ERRORS;
+        errors[i] = pendingRing[index];
+        pendingRing[index] = undefined;
+    }
+    pendingCount = 0;
+    return errors;
+}
+
+// Merge buffered errors into storage with one get/set round-trip
+function flushErrors() {
+    flushTimer = null;
+    const count = pendingCount;
+    const batch = takePendingErrors();
+    
+    __API__.storage.local.get(['recentErrors', 'errorCount'], function(result) {
+        // Newest first, keeping only the last MAX_RECENT_ERRORS
+        const recentErrors = batch
+            .concat(result.recentErrors || [])
+            .slice(0, MAX_RECENT_ERRORS);
+        const errorCount = (result.errorCount || 0) + count;
+        
+        __API__.storage.local.set({recentErrors: recentErrors, errorCount: errorCount});
         
         // Update badge with error count
-        chrome.storage.local.get(['errorCount'], function(result) {{
-            const errorCount = (result.errorCount || 0) + 1;
-            chrome.storage.local.set({{errorCount: errorCount}});
-            
-            chrome.action.setBadgeText({{
+        const tabIds = new Set(batch.map(error => error.tab_id));
+        for (const tabId of tabIds) {
+            __API__.action.setBadgeText({
                 text: errorCount.toString(),
-                tabId: sender.tab.id
-            }});
-            chrome.action.setBadgeBackgroundColor({{color: '#ff6b6b'}});
-        }});
+                tabId: tabId
+            });
+        }
+        __API__.action.setBadgeBackgroundColor({color: '#ff6b6b'});
+    });
+}
+
+__API__.runtime.onMessage.addListener(function(request, sender, sendResponse) {
+    if (request.type === 'ERROR_COLLECTED') {
+        // Buffer the error for popup display; storage is written in batches
+        // Ring buffer insert is O(1); once full the oldest pending error is overwritten
+        pendingRing[pendingHead] = {
+            ...request.data,
+            tab_id: sender.tab.id,
+            tab_url: sender.tab.url
+        };
+        pendingHead = (pendingHead + 1) % MAX_RECENT_ERRORS;
+        pendingCount++;
+        
+        if (!flushTimer) {
+            flushTimer = setTimeout(flushErrors, FLUSH_DELAY_MS);
+        }
         
-        sendResponse({{success: true}});
-    }}
-}});
+        sendResponse({success: true});
+    }
+});
 
 // Clear badge when tab is updated
-chrome.tabs.onUpdated.addListener(function(tabId, changeInfo, tab) {{
-    if (changeInfo.status === 'loading') {{
-        chrome.action.setBadgeText({{text: '', tabId: tabId}});
-    }}
-}});
+__API__.tabs.onUpdated.addListener(function(tabId, changeInfo, tab) {
+    if (changeInfo.status === 'loading') {
+        __API__.action.setBadgeText({text: '', tabId: tabId});
+    }
+});
 
 // Handle extension installation
-chrome.runtime.onInstalled.addListener(function(details) {{
-    if (details.reason === 'install') {{
-        chrome.storage.sync.set({{errorCollectionEnabled: true}});
+__API__.runtime.onInstalled.addListener(function(details) {
+    if (details.reason === 'install') {
+        __API__.storage.sync.set({errorCollectionEnabled: true});
         console.log('Error Collector MCP extension installed');
-    }}
-}});
-'''
-    
-    def _get_background_script_firefox(self) -> str:
-        """Get background script for Firefox."""
-        return self._get_background_script().replace('chrome.', 'browser.')
-    
-    def _get_popup_html(self) -> str:
-        """Get popup HTML."""
-        return '''<!DOCTYPE html>
+    }
+});
+''')
+
+_POPUP_HTML = _minify_html('''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -603,11 +483,9 @@ chrome.runtime.onInstalled.addListener(function(details) {{
     
     <script src="popup.js"></script>
 </body>
-</html>'''
-    
-    def _get_popup_script(self) -> str:
-        """Get popup JavaScript."""
-        return '''
+</html>''')
+
+_POPUP_SCRIPT_TEMPLATE = _minify_js('''
 // Error Collector MCP - Popup Script
 document.addEventListener('DOMContentLoaded', function() {
     const toggleSwitch = document.getElementById('toggleSwitch');
@@ -619,7 +497,7 @@ document.addEventListener('DOMContentLoaded', function() {
     const exportBtn = document.getElementById('exportBtn');
     
     // Load current state
-    chrome.storage.sync.get(['errorCollectionEnabled'], function(result) {
+    __API__.storage.sync.get(['errorCollectionEnabled'], function(result) {
         const enabled = result.errorCollectionEnabled !== false;
         updateToggleState(enabled);
     });
@@ -632,12 +510,12 @@ document.addEventListener('DOMContentLoaded', function() {
         const isActive = toggleSwitch.classList.contains('active');
         const newState = !isActive;
         
-        chrome.storage.sync.set({errorCollectionEnabled: newState});
+        __API__.storage.sync.set({errorCollectionEnabled: newState});
         updateToggleState(newState);
         
         // Notify content scripts
-        chrome.tabs.query({active: true, currentWindow: true}, function(tabs) {
-            chrome.tabs.sendMessage(tabs[0].id, {
+        __API__.tabs.query({active: true, currentWindow: true}, function(tabs) {
+            __API__.tabs.sendMessage(tabs[0].id, {
                 type: 'TOGGLE_COLLECTION',
                 enabled: newState
             });
@@ -646,13 +524,13 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // Clear errors
     clearBtn.addEventListener('click', function() {
-        chrome.storage.local.clear();
+        __API__.storage.local.clear();
         loadErrorStats();
     });
     
     // Export errors
     exportBtn.addEventListener('click', function() {
-        chrome.storage.local.get(['recentErrors'], function(result) {
+        __API__.storage.local.get(['recentErrors'], function(result) {
             const errors = result.recentErrors || [];
             const dataStr = JSON.stringify(errors, null, 2);
             const dataBlob = new Blob([dataStr], {type: 'application/json'});
@@ -677,14 +555,14 @@ document.addEventListener('DOMContentLoaded', function() {
     }
     
     function loadErrorStats() {
-        chrome.storage.local.get(['recentErrors', 'errorCount'], function(result) {
+        __API__.storage.local.get(['recentErrors', 'errorCount'], function(result) {
             const recentErrors = result.recentErrors || [];
             const errorCount = result.errorCount || 0;
             
             errorCountEl.textContent = errorCount;
             
             // Count errors for current page
-            chrome.tabs.query({active: true, currentWindow: true}, function(tabs) {
+            __API__.tabs.query({active: true, currentWindow: true}, function(tabs) {
                 const currentUrl = tabs[0].url;
                 const pageErrors = recentErrors.filter(error => error.url === currentUrl);
                 pageErrorsEl.textContent = pageErrors.length;
@@ -719,11 +597,308 @@ document.addEventListener('DOMContentLoaded', function() {
         return div.innerHTML;
     }
 });
-'''
+''')
+
+# Firefox exposes the same extension APIs under the browser namespace
+_BACKGROUND_SCRIPT = _render(_BACKGROUND_SCRIPT_TEMPLATE, api='chrome')
+_BACKGROUND_SCRIPT_FIREFOX = _render(_BACKGROUND_SCRIPT_TEMPLATE, api='browser')
+_POPUP_SCRIPT = _render(_POPUP_SCRIPT_TEMPLATE, api='chrome')
+_POPUP_SCRIPT_FIREFOX = _render(_POPUP_SCRIPT_TEMPLATE, api='browser')
+
+# Port-independent files, encoded once for every build and package
+_ICON_SVG_BYTES = _ICON_SVG.encode()
+_BACKGROUND_SCRIPT_BYTES = _BACKGROUND_SCRIPT.encode()
+_BACKGROUND_SCRIPT_FIREFOX_BYTES = _BACKGROUND_SCRIPT_FIREFOX.encode()
+_POPUP_HTML_BYTES = _POPUP_HTML.encode()
+_POPUP_SCRIPT_BYTES = _POPUP_SCRIPT.encode()
+_POPUP_SCRIPT_FIREFOX_BYTES = _POPUP_SCRIPT_FIREFOX.encode()
+
+
+class BrowserExtensionBuilder:
+    """Builder for browser extension files."""
+    
+    def __init__(self, collector_port: int = 8766, pretty_manifest: bool = False):
+        self.collector_port = collector_port
+        # Browsers don't need an indented manifest; compact JSON is smaller and faster
+        self.pretty_manifest = pretty_manifest
+        # Generated files keyed by (name, port, pretty_manifest)
+        self._generated: Dict[Tuple[str, int, bool], Any] = {}
+    
+    def build_chrome_extension(self, output_dir: Path) -> Path:
+        """Build Chrome extension files."""
+        return self._write_members(output_dir, self._iter_chrome_members())
+    
+    def build_firefox_extension(self, output_dir: Path) -> Path:
+        """Build Firefox extension files."""
+        return self._write_members(output_dir, self._iter_firefox_members())
+    
+    def package_chrome_extension(self, output_file: Path, compress_level: int = 6) -> Path:
+        """Package the Chrome extension straight into a zip file."""
+        return self.create_extension_package(self._iter_chrome_members(), output_file, compress_level)
+    
+    def package_firefox_extension(self, output_file: Path, compress_level: int = 6) -> Path:
+        """Package the Firefox extension straight into a zip file."""
+        return self.create_extension_package(self._iter_firefox_members(), output_file, compress_level)
+    
+    def build_extensions(
+        self,
+        browsers: Iterable[str],
+        output_dir: Path,
+        package: bool = False,
+        package_only: bool = False,
+        compress_level: int = 6
+    ) -> List[str]:
+        """Build and/or package extensions for several browsers concurrently.
+        
+        browsers are "chrome" and/or "firefox". Unpacked directories are
+        always written unless package_only, which implies package. Returns
+        progress messages in browser order.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        package = package or package_only
+        build_unpacked = not package_only
+        
+        steps = {
+            "chrome": ("Chrome", self.build_chrome_extension, self.package_chrome_extension),
+            "firefox": ("Firefox", self.build_firefox_extension, self.package_firefox_extension)
+        }
+        
+        def build(browser: str) -> List[str]:
+            name, build_dir, package_file = steps[browser]
+            messages = []
+            if build_unpacked:
+                messages.append(f"{name} extension built in: {build_dir(output_dir / browser)}")
+            if package:
+                zip_file = package_file(output_dir / f"error-collector-mcp-{browser}.zip", compress_level)
+                messages.append(f"{name} extension packaged: {zip_file}")
+            return messages
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(build, browsers))
+        
+        return [message for messages in results for message in messages]
+    
+    def create_extension_package(
+        self,
+        extension: Union[Path, Iterable[Tuple[str, bytes]]],
+        output_file: Path,
+        compress_level: int = 6
+    ) -> Path:
+        """Create a packaged extension file.
+        
+        extension is either a built extension directory or an iterable of
+        (arcname, data) members, which are written without touching disk.
+        compress_level is the DEFLATE level (0-9): 1 is fastest for local
+        iteration, 9 gives the smallest archive for distribution.
+        """
+        if libarchive is not None:
+            return self._write_package_libarchive(extension, output_file, compress_level)
+        
+        with zipfile.ZipFile(
+            output_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=compress_level
+        ) as zf:
+            if isinstance(extension, Path):
+                for file_path, arcname in _walk_files(str(extension)):
+                    zf.write(file_path, arcname)
+            else:
+                for arcname, data in extension:
+                    zf.writestr(arcname, data)
+        
+        return output_file
+    
+    @staticmethod
+    def _write_package_libarchive(
+        extension: Union[Path, Iterable[Tuple[str, bytes]]],
+        output_file: Path,
+        compress_level: int
+    ) -> Path:
+        """Write the zip with libarchive, whose framing and CRC run in C."""
+        with libarchive.file_writer(
+            str(output_file), 'zip', options=f'compression-level={compress_level}'
+        ) as archive:
+            if isinstance(extension, Path):
+                for file_path, arcname in _walk_files(str(extension)):
+                    archive.add_files(file_path, pathname=arcname)
+            else:
+                for arcname, data in extension:
+                    archive.add_file_from_memory(arcname, len(data), data, permission=0o644)
+        
+        return output_file
+    
+    def _iter_chrome_members(self) -> Iterator[Tuple[str, bytes]]:
+        """Yield (arcname, data) for each Chrome extension file."""
+        return iter(self._cached('members_chrome', lambda: (
+            ("manifest.json", _manifest_bytes(3, self.pretty_manifest)),
+            ("content.js", self._get_content_script().encode()),
+            ("background.js", _BACKGROUND_SCRIPT_BYTES),
+            ("popup.html", _POPUP_HTML_BYTES),
+            ("popup.js", _POPUP_SCRIPT_BYTES),
+            ("icon.svg", _ICON_SVG_BYTES),
+        )))
+    
+    def _iter_firefox_members(self) -> Iterator[Tuple[str, bytes]]:
+        """Yield (arcname, data) for each Firefox extension file."""
+        # Manifest v2 and browser.* APIs; popup HTML and icon are shared with Chrome
+        return iter(self._cached('members_firefox', lambda: (
+            ("manifest.json", _manifest_bytes(2, self.pretty_manifest)),
+            ("content.js", self._get_content_script_firefox().encode()),
+            ("background.js", _BACKGROUND_SCRIPT_FIREFOX_BYTES),
+            ("popup.html", _POPUP_HTML_BYTES),
+            ("popup.js", _POPUP_SCRIPT_FIREFOX_BYTES),
+            ("icon.svg", _ICON_SVG_BYTES),
+        )))
+    
+    @staticmethod
+    def _write_members(output_dir: Path, members: Iterable[Tuple[str, bytes]]) -> Path:
+        """Write extension members into output_dir."""
+        # Generate every file before touching disk, then create each directory once
+        files = [(output_dir / arcname, data) for arcname, data in members]
+        for directory in {path.parent for path, _ in files}:
+            directory.mkdir(parents=True, exist_ok=True)
+        
+        # Pre-encoded bytes, so each file is one binary write with no text layer;
+        # writes release the GIL and overlap across threads
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), files))
+        
+        return output_dir
+    
+    def _get_manifest_v3(self) -> Dict[str, Any]:
+        """Get Chrome extension manifest v3."""
+        return self._cached('manifest_v3', self._build_manifest_v3)
+    
+    def _get_manifest_v2(self) -> Dict[str, Any]:
+        """Get Firefox extension manifest v2."""
+        return self._cached('manifest_v2', self._build_manifest_v2)
+    
+    @classmethod
+    def _build_manifest_v3(cls) -> Dict[str, Any]:
+        return {
+            "manifest_version": 3,
+            **cls._base_manifest(),
+            "permissions": ["activeTab", "storage"],
+            "host_permissions": ["<all_urls>"],
+            "content_scripts": cls._content_scripts(),
+            "background": {"service_worker": "background.js"},
+            "action": cls._action(),
+            "icons": cls._icons()
+        }
+    
+    @classmethod
+    def _build_manifest_v2(cls) -> Dict[str, Any]:
+        return {
+            "manifest_version": 2,
+            **cls._base_manifest(),
+            "permissions": ["activeTab", "storage", "<all_urls>"],
+            "content_scripts": cls._content_scripts(),
+            "background": {"scripts": ["background.js"], "persistent": False},
+            "browser_action": cls._action(),
+            "icons": cls._icons()
+        }
+    
+    # Manifest parts shared by the Chrome (v3) and Firefox (v2) manifests.
+    # Each call returns fresh objects, so callers can't mutate another manifest.
+    
+    @staticmethod
+    def _base_manifest() -> Dict[str, Any]:
+        return {
+            "name": "Error Collector MCP",
+            "version": "1.0.0",
+            "description": "Collect JavaScript errors for AI analysis with Kiro"
+        }
+    
+    @staticmethod
+    def _icons() -> Dict[str, str]:
+        return {
+            "16": "icon.svg",
+            "32": "icon.svg",
+            "48": "icon.svg",
+            "128": "icon.svg"
+        }
+    
+    @staticmethod
+    def _content_scripts() -> List[Dict[str, Any]]:
+        return [{
+            "matches": ["<all_urls>"],
+            "js": ["content.js"],
+            "run_at": "document_start",
+            "all_frames": True
+        }]
+    
+    @classmethod
+    def _action(cls) -> Dict[str, Any]:
+        return {
+            "default_popup": "popup.html",
+            "default_title": "Error Collector MCP",
+            "default_icon": cls._icons()
+        }
+    
+    def _cached(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return a generated file, building it once per builder, port and manifest format."""
+        key = (name, self.collector_port, self.pretty_manifest)
+        value = self._generated.get(key)
+        if value is None:
+            value = self._generated[key] = build()
+        return value
+    
+    def _get_content_script(self) -> str:
+        """Get content script for Chrome."""
+        return self._cached('content_chrome', lambda: self._render_content_script('chrome'))
+    
+    def _get_content_script_firefox(self) -> str:
+        """Get content script for Firefox (similar to Chrome but with browser API)."""
+        return self._cached('content_firefox', lambda: self._render_content_script('browser'))
+    
+    def _render_content_script(self, api: str) -> str:
+        """Fill the content script template for an API namespace and this port."""
+        return _render(
+            _CONTENT_SCRIPT_TEMPLATE,
+            api=api,
+            server_url=f'http://localhost:{self.collector_port}/collect'
+        )
+    
+    def _get_background_script(self) -> str:
+        """Get background script for Chrome."""
+        return _BACKGROUND_SCRIPT
+    
+    def _get_background_script_firefox(self) -> str:
+        """Get background script for Firefox."""
+        return _BACKGROUND_SCRIPT_FIREFOX
+    
+    def _get_popup_html(self) -> str:
+        """Get popup HTML."""
+        return _POPUP_HTML
+    
+    def _get_popup_script(self) -> str:
+        """Get popup JavaScript."""
+        return _POPUP_SCRIPT
     
     def _get_popup_script_firefox(self) -> str:
         """Get popup script for Firefox."""
-        return self._get_popup_script().replace('chrome.', 'browser.')
+        return _POPUP_SCRIPT_FIREFOX
+
+
+def _walk_files(directory: str, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """Yield (path, arcname) for files under directory using scandir's cached entry types."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            arcname = prefix + entry.name
+            if entry.is_dir():
+                yield from _walk_files(entry.path, arcname + "/")
+            elif entry.is_file():
+                yield entry.path, arcname
+
+
+@lru_cache(maxsize=None)
+def _manifest_bytes(manifest_version: int, pretty: bool) -> bytes:
+    """Encoded manifest.json, compact unless pretty; shared by all builders and ports."""
+    if manifest_version == 3:
+        manifest = BrowserExtensionBuilder._build_manifest_v3()
+    else:
+        manifest = BrowserExtensionBuilder._build_manifest_v2()
+    if pretty:
+        return json.dumps(manifest, indent=2).encode()
+    return json.dumps(manifest, separators=(",", ":")).encode()
 
 
 def main():
@@ -735,29 +910,25 @@ def main():
     parser.add_argument("--output-dir", type=str, default="./browser-extensions", help="Output directory")
     parser.add_argument("--port", type=int, default=8766, help="Collector server port")
     parser.add_argument("--package", action="store_true", help="Create packaged extension files")
+    parser.add_argument("--pretty", action="store_true", help="Indent manifest.json for readability")
+    parser.add_argument("--package-only", action="store_true",
+                        help="Only create packaged files, without the unpacked extension directories")
+    parser.add_argument("--compress-level", type=int, choices=range(10), default=9, metavar="{0-9}",
+                        help="DEFLATE level for packaged files (1 = fastest, 9 = smallest)")
     
     args = parser.parse_args()
     
-    builder = BrowserExtensionBuilder(args.port)
-    output_dir = Path(args.output_dir)
-    
-    if args.command in ["build-chrome", "build-all"]:
-        chrome_dir = builder.build_chrome_extension(output_dir / "chrome")
-        print(f"Chrome extension built in: {chrome_dir}")
-        
-        if args.package:
-            package_file = output_dir / "error-collector-mcp-chrome.zip"
-            builder.create_extension_package(chrome_dir, package_file)
-            print(f"Chrome extension packaged: {package_file}")
-    
-    if args.command in ["build-firefox", "build-all"]:
-        firefox_dir = builder.build_firefox_extension(output_dir / "firefox")
-        print(f"Firefox extension built in: {firefox_dir}")
-        
-        if args.package:
-            package_file = output_dir / "error-collector-mcp-firefox.zip"
-            builder.create_extension_package(firefox_dir, package_file)
-            print(f"Firefox extension packaged: {package_file}")
+    builder = BrowserExtensionBuilder(args.port, pretty_manifest=args.pretty)
+    browsers = {
+        "build-chrome": ["chrome"],
+        "build-firefox": ["firefox"],
+        "build-all": ["chrome", "firefox"]
+    }[args.command]
+    
+    for message in builder.build_extensions(
+        browsers, Path(args.output_dir), args.package, args.package_only, args.compress_level
+    ):
+        print(message)
 
 
 if __name__ == "__main__":
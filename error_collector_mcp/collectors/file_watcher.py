@@ -0,0 +1,61 @@
+"""Filesystem change notifications for collectors that tail log files."""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - watchdog is a declared dependency
+    FileSystemEventHandler = object
+    Observer = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class FileChangeHandler(FileSystemEventHandler):
+    """Set an asyncio event when the watched file changes."""
+    
+    def __init__(self, path: Path, loop: asyncio.AbstractEventLoop, changed: asyncio.Event):
+        super().__init__()
+        # Resolved, so relative and symlinked spellings of the path still match
+        self._path = os.path.realpath(path)
+        self._loop = loop
+        self._changed = changed
+    
+    def _matches(self, event_path) -> bool:
+        return bool(event_path) and os.path.realpath(event_path) == self._path
+    
+    def on_modified(self, event) -> None:
+        # Moves count when the watched file is the destination (rename-style rotation)
+        if self._matches(event.src_path) or self._matches(getattr(event, "dest_path", None)):
+            self._loop.call_soon_threadsafe(self._changed.set)
+    
+    on_created = on_modified
+    on_moved = on_modified
+
+
+def start_file_watcher(path: Path, changed: asyncio.Event) -> Optional["Observer"]:
+    """Watch path and set changed on every modification.
+    
+    Must be called from the event loop. Returns the running observer, or None
+    when no watcher is available and the caller should poll instead.
+    """
+    if Observer is None:
+        return None
+    
+    path = path.resolve()
+    try:
+        handler = FileChangeHandler(path, asyncio.get_running_loop(), changed)
+        observer = Observer()
+        observer.schedule(handler, str(path.parent), recursive=False)
+        observer.daemon = True
+        observer.start()
+        return observer
+    except Exception as e:
+        logger.warning(f"File watcher unavailable, polling {path} instead: {e}")
+        return None
@@ -4,131 +4,108 @@ import os
 import sys
 import json
 import tempfile
+import threading
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-class ShellWrapper:
-    """Wrapper for shell commands to capture errors."""
-    
-    def __init__(self, collector_endpoint: Optional[str] = None):
-        self.collector_endpoint = collector_endpoint
-        self.log_file = self._get_log_file()
-    
-    def _get_log_file(self) -> Path:
-        """Get the log file path for error collection."""
-        # Use a temporary directory for the log file
-        temp_dir = Path(tempfile.gettempdir()) / "error-collector-mcp"
-        temp_dir.mkdir(exist_ok=True)
-        return temp_dir / "terminal_errors.log"
-    
-    def wrap_command(self, command: str, exit_code: int, stderr: str, stdout: str) -> None:
-        """Wrap a command execution and log any errors."""
-        if exit_code != 0 or self._has_error_indicators(stderr):
-            error_data = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "command": command,
-                "exit_code": exit_code,
-                "stderr": stderr,
-                "stdout": stdout,
-                "working_directory": os.getcwd(),
-                "environment": dict(os.environ)
-            }
-            
-            self._log_error(error_data)
-    
-    def _has_error_indicators(self, stderr: str) -> bool:
-        """Check if stderr contains error indicators."""
-        error_keywords = [
-            "error:", "fatal:", "warning:", "failed", "exception",
-            "traceback", "stack trace", "segmentation fault"
-        ]
-        
-        stderr_lower = stderr.lower()
-        return any(keyword in stderr_lower for keyword in error_keywords)
-    
-    def _log_error(self, error_data: Dict[str, Any]) -> None:
-        """Log error data to file."""
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                json.dump(error_data, f)
-                f.write('\n')
-        except Exception as e:
-            # Fallback to stderr if logging fails
-            print(f"Failed to log error: {e}", file=sys.stderr)
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        # Naive datetimes are UTC and serialize as ISO 8601 with a Z suffix
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+else:  # pragma: no cover - exercised only without orjson
+    def _json_default(obj: Any) -> str:
+        if isinstance(obj, datetime):
+            return obj.isoformat() + "Z"
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
     
-    def generate_bash_integration(self) -> str:
-        """Generate bash integration script."""
-        wrapper_script = f'''
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=_json_default).encode('utf-8')
+
+
+# Literal markers that flag stderr from a successful command; matched against
+# the lowercased text
+_ERROR_KEYWORDS = (
+    "error:", "fatal:", "warning:", "failed", "exception",
+    "traceback", "stack trace", "segmentation fault"
+)
+
+
+# Shell integration scripts; __LOG_FILE__ is replaced with the log path
+_BASH_INTEGRATION = '''
 # Error Collector MCP - Bash Integration
 # Add this to your ~/.bashrc or ~/.bash_profile
 
-export ERROR_COLLECTOR_LOG_FILE="{self.log_file}"
+export ERROR_COLLECTOR_LOG_FILE="__LOG_FILE__"
 
 # Function to capture command results
-_error_collector_capture() {{
+_error_collector_capture() {
     local exit_code=$?
-    local command="${{BASH_COMMAND}}"
+    local command="${BASH_COMMAND}"
     
     if [ $exit_code -ne 0 ]; then
-        echo "{{
+        echo "{
             \\"timestamp\\": \\"$(date -u +%Y-%m-%dT%H:%M:%S)\\",
             \\"command\\": \\"$command\\",
             \\"exit_code\\": $exit_code,
             \\"working_directory\\": \\"$(pwd)\\",
             \\"shell\\": \\"bash\\"
-        }}" >> "$ERROR_COLLECTOR_LOG_FILE"
+        }" >> "$ERROR_COLLECTOR_LOG_FILE"
     fi
     
     return $exit_code
-}}
+}
 
 # Set up trap to capture command failures
 trap '_error_collector_capture' ERR
 
 # Optional: Function to manually report errors
-error_collector_report() {{
+error_collector_report() {
     local message="$1"
-    echo "{{
+    echo "{
         \\"timestamp\\": \\"$(date -u +%Y-%m-%dT%H:%M:%S)\\",
         \\"message\\": \\"$message\\",
         \\"command\\": \\"manual_report\\",
         \\"working_directory\\": \\"$(pwd)\\",
         \\"shell\\": \\"bash\\"
-    }}" >> "$ERROR_COLLECTOR_LOG_FILE"
-}}
+    }" >> "$ERROR_COLLECTOR_LOG_FILE"
+}
 '''
-        return wrapper_script
-    
-    def generate_zsh_integration(self) -> str:
-        """Generate zsh integration script."""
-        wrapper_script = f'''
+
+_ZSH_INTEGRATION = '''
 # Error Collector MCP - Zsh Integration
 # Add this to your ~/.zshrc
 
-export ERROR_COLLECTOR_LOG_FILE="{self.log_file}"
+export ERROR_COLLECTOR_LOG_FILE="__LOG_FILE__"
 
 # Function to capture command results
-_error_collector_preexec() {{
+_error_collector_preexec() {
     _ERROR_COLLECTOR_COMMAND="$1"
-}}
+}
 
-_error_collector_precmd() {{
+_error_collector_precmd() {
     local exit_code=$?
     
     if [ $exit_code -ne 0 ] && [ -n "$_ERROR_COLLECTOR_COMMAND" ]; then
-        echo "{{
+        echo "{
             \\"timestamp\\": \\"$(date -u +%Y-%m-%dT%H:%M:%S)\\",
             \\"command\\": \\"$_ERROR_COLLECTOR_COMMAND\\",
             \\"exit_code\\": $exit_code,
             \\"working_directory\\": \\"$(pwd)\\",
             \\"shell\\": \\"zsh\\"
-        }}" >> "$ERROR_COLLECTOR_LOG_FILE"
+        }" >> "$ERROR_COLLECTOR_LOG_FILE"
     fi
     
     _ERROR_COLLECTOR_COMMAND=""
-}}
+}
 
 # Set up hooks
 autoload -Uz add-zsh-hook
@@ -136,55 +113,222 @@ add-zsh-hook preexec _error_collector_preexec
 add-zsh-hook precmd _error_collector_precmd
 
 # Optional: Function to manually report errors
-error_collector_report() {{
+error_collector_report() {
     local message="$1"
-    echo "{{
+    echo "{
         \\"timestamp\\": \\"$(date -u +%Y-%m-%dT%H:%M:%S)\\",
         \\"message\\": \\"$message\\",
         \\"command\\": \\"manual_report\\",
         \\"working_directory\\": \\"$(pwd)\\",
         \\"shell\\": \\"zsh\\"
-    }}" >> "$ERROR_COLLECTOR_LOG_FILE"
-}}
+    }" >> "$ERROR_COLLECTOR_LOG_FILE"
+}
 '''
-        return wrapper_script
-    
-    def generate_fish_integration(self) -> str:
-        """Generate fish shell integration script."""
-        wrapper_script = f'''
+
+_FISH_INTEGRATION = '''
 # Error Collector MCP - Fish Integration
 # Add this to your ~/.config/fish/config.fish
 
-set -gx ERROR_COLLECTOR_LOG_FILE "{self.log_file}"
+set -gx ERROR_COLLECTOR_LOG_FILE "__LOG_FILE__"
 
 # Function to capture command failures
 function _error_collector_capture --on-event fish_postexec
     set exit_code $status
     
     if test $exit_code -ne 0
-        echo "{{
+        echo "{
             \\"timestamp\\": \\"(date -u +%Y-%m-%dT%H:%M:%S)\\",
             \\"command\\": \\"$argv[1]\\",
             \\"exit_code\\": $exit_code,
             \\"working_directory\\": \\"(pwd)\\",
             \\"shell\\": \\"fish\\"
-        }}" >> $ERROR_COLLECTOR_LOG_FILE
+        }" >> $ERROR_COLLECTOR_LOG_FILE
     end
 end
 
 # Optional: Function to manually report errors
 function error_collector_report
     set message $argv[1]
-    echo "{{
+    echo "{
         \\"timestamp\\": \\"(date -u +%Y-%m-%dT%H:%M:%S)\\",
         \\"message\\": \\"$message\\",
         \\"command\\": \\"manual_report\\",
         \\"working_directory\\": \\"(pwd)\\",
         \\"shell\\": \\"fish\\"
-    }}" >> $ERROR_COLLECTOR_LOG_FILE
+    }" >> $ERROR_COLLECTOR_LOG_FILE
 end
 '''
-        return wrapper_script
+
+
+# Per-shell setup steps for get_integration_instructions
+_INTEGRATION_STEPS = {
+    "bash": """
+1. Add to ~/.bashrc or ~/.bash_profile:
+   source ~/.error_collector_bash
+
+2. Or run the installation command:
+   error-collector-mcp install-shell-integration bash
+
+3. Restart your terminal or run:
+   source ~/.bashrc
+""",
+    "zsh": """
+1. Add to ~/.zshrc:
+   source ~/.error_collector_zsh
+
+2. Or run the installation command:
+   error-collector-mcp install-shell-integration zsh
+
+3. Restart your terminal or run:
+   source ~/.zshrc
+""",
+    "fish": """
+1. The integration will be automatically loaded from:
+   ~/.config/fish/conf.d/error_collector.fish
+
+2. Or run the installation command:
+   error-collector-mcp install-shell-integration fish
+
+3. Restart your terminal or run:
+   source ~/.config/fish/config.fish
+"""
+}
+
+
+@lru_cache(maxsize=None)
+def _default_log_file() -> Path:
+    """Return the default log path, creating its directory once per process."""
+    # Use a temporary directory for the log file
+    temp_dir = Path(tempfile.gettempdir()) / "error-collector-mcp"
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir / "terminal_errors.log"
+
+
+@lru_cache(maxsize=None)
+def _shell_from_path(shell_path: str) -> str:
+    """Map a $SHELL path to a supported shell name."""
+    shell_name = Path(shell_path).name
+    
+    if shell_name in ['bash', 'zsh', 'fish']:
+        return shell_name
+    
+    # Default to bash if unknown
+    return 'bash'
+
+
+class ShellWrapper:
+    """Wrapper for shell commands to capture errors."""
+    
+    def __init__(
+        self,
+        collector_endpoint: Optional[str] = None,
+        flush_every: int = 1,
+        fsync_every: int = 0
+    ):
+        self.collector_endpoint = collector_endpoint
+        self.log_file = self._get_log_file()
+        
+        # Records are appended through one long-lived buffered handle. By default
+        # each record is flushed so tailing readers see it at once; raise
+        # flush_every to batch bursts. fsync_every > 0 also syncs every N records.
+        self.flush_every = max(1, flush_every)
+        self.fsync_every = fsync_every
+        self._log_fp: Optional[BinaryIO] = None
+        self._log_fp_path: Optional[Path] = None
+        self._log_finalizer: Optional[weakref.finalize] = None
+        self._log_lock = threading.Lock()
+        self._unflushed = 0
+        self._unsynced = 0
+    
+    def _get_log_file(self) -> Path:
+        """Get the log file path for error collection."""
+        return _default_log_file()
+    
+    def wrap_command(self, command: str, exit_code: int, stderr: str, stdout: str) -> None:
+        """Wrap a command execution and log any errors."""
+        if exit_code != 0 or self._has_error_indicators(stderr):
+            error_data = {
+                "timestamp": datetime.utcnow(),
+                "command": command,
+                "exit_code": exit_code,
+                "stderr": stderr,
+                "stdout": stdout,
+                "working_directory": os.getcwd(),
+                "environment": dict(os.environ)
+            }
+            
+            self._log_error(error_data)
+    
+    def _has_error_indicators(self, stderr: str) -> bool:
+        """Check if stderr contains error indicators."""
+        if not stderr:
+            return False
+        stderr_lower = stderr.lower()
+        return any(keyword in stderr_lower for keyword in _ERROR_KEYWORDS)
+    
+    def _log_error(self, error_data: Dict[str, Any]) -> None:
+        """Log error data to file."""
+        try:
+            line = _dumps(error_data) + b'\n'
+            with self._log_lock:
+                fp = self._get_log_fp()
+                fp.write(line)
+                self._unflushed += 1
+                self._unsynced += 1
+                if self.fsync_every and self._unsynced >= self.fsync_every:
+                    self._flush_locked(fsync=True)
+                elif self._unflushed >= self.flush_every:
+                    self._flush_locked(fsync=False)
+        except Exception as e:
+            # Fallback to stderr if logging fails
+            print(f"Failed to log error: {e}", file=sys.stderr)
+    
+    def flush(self, fsync: bool = False) -> None:
+        """Flush buffered records to the log file, optionally fsyncing it."""
+        with self._log_lock:
+            if self._log_fp is not None:
+                self._flush_locked(fsync)
+    
+    def close(self) -> None:
+        """Flush and close the log file handle."""
+        with self._log_lock:
+            if self._log_finalizer is not None:
+                self._log_finalizer()
+            self._log_fp = None
+            self._log_fp_path = None
+            self._log_finalizer = None
+            self._unflushed = 0
+            self._unsynced = 0
+    
+    def _get_log_fp(self) -> BinaryIO:
+        """Return the append handle, reopening it if log_file changed."""
+        if self._log_fp is None or self._log_fp_path != self.log_file:
+            if self._log_finalizer is not None:
+                self._log_finalizer()
+            self._log_fp = open(self.log_file, 'ab', buffering=64 * 1024)
+            self._log_fp_path = self.log_file
+            # Flush and close on garbage collection or interpreter exit
+            self._log_finalizer = weakref.finalize(self, self._log_fp.close)
+        return self._log_fp
+    
+    def _flush_locked(self, fsync: bool) -> None:
+        self._log_fp.flush()
+        self._unflushed = 0
+        if fsync:
+            os.fsync(self._log_fp.fileno())
+            self._unsynced = 0
+    
+    def generate_bash_integration(self) -> str:
+        """Generate bash integration script."""
+        return _BASH_INTEGRATION.replace("__LOG_FILE__", str(self.log_file))
+    
+    def generate_zsh_integration(self) -> str:
+        """Generate zsh integration script."""
+        return _ZSH_INTEGRATION.replace("__LOG_FILE__", str(self.log_file))
+    
+    def generate_fish_integration(self) -> str:
+        """Generate fish shell integration script."""
+        return _FISH_INTEGRATION.replace("__LOG_FILE__", str(self.log_file))
     
     def install_shell_integration(self, shell: str = "auto") -> str:
         """Install shell integration for the specified shell."""
@@ -215,14 +359,7 @@ end
     
     def _detect_shell(self) -> str:
         """Detect the current shell."""
-        shell_path = os.environ.get('SHELL', '/bin/bash')
-        shell_name = Path(shell_path).name
-        
-        if shell_name in ['bash', 'zsh', 'fish']:
-            return shell_name
-        
-        # Default to bash if unknown
-        return 'bash'
+        return _shell_from_path(os.environ.get('SHELL', '/bin/bash'))
     
     def get_integration_instructions(self, shell: str = "auto") -> str:
         """Get instructions for manual shell integration."""
@@ -238,39 +375,7 @@ To enable automatic error collection, add the following to your shell configurat
 
 """
         
-        if shell == "bash":
-            instructions += f"""
-1. Add to ~/.bashrc or ~/.bash_profile:
-   source ~/.error_collector_bash
-
-2. Or run the installation command:
-   error-collector-mcp install-shell-integration bash
-
-3. Restart your terminal or run:
-   source ~/.bashrc
-"""
-        elif shell == "zsh":
-            instructions += f"""
-1. Add to ~/.zshrc:
-   source ~/.error_collector_zsh
-
-2. Or run the installation command:
-   error-collector-mcp install-shell-integration zsh
-
-3. Restart your terminal or run:
-   source ~/.zshrc
-"""
-        elif shell == "fish":
-            instructions += f"""
-1. The integration will be automatically loaded from:
-   ~/.config/fish/conf.d/error_collector.fish
-
-2. Or run the installation command:
-   error-collector-mcp install-shell-integration fish
-
-3. Restart your terminal or run:
-   source ~/.config/fish/config.fish
-"""
+        instructions += _INTEGRATION_STEPS.get(shell, "")
         
         instructions += f"""
 
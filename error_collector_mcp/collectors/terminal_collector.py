@@ -3,22 +3,74 @@
 import asyncio
 import logging
 import os
+import re
 import subprocess
 import shlex
 import signal
 import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, Any
+from typing import Deque, List, Dict, Optional, Callable, Any, Set
 from dataclasses import dataclass
 
 from .base_collector import BaseCollector
+from .file_watcher import start_file_watcher
 from ..models import TerminalError, ErrorSeverity
 
 
 logger = logging.getLogger(__name__)
 
 
+def _keywords(*keywords: str) -> "re.Pattern[str]":
+    """Compile lowercase literal keywords into one alternation."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Severity tiers for lowercased stderr, checked from most to least severe.
+# Patterns are matched against lowercased text rather than with IGNORECASE,
+# which disables the regex engine's literal-prefix search and is ~10x slower.
+_CRITICAL_STDERR = _keywords("fatal", "critical", "segmentation fault", "core dumped", "out of memory")
+_HIGH_STDERR = _keywords("error:", "compilation failed", "build failed", "test failed")
+_LOW_STDERR = _keywords("warning", "deprecated", "notice")
+
+# Environment variables recorded on command results. Subprocesses still
+# inherit the full environment; it just isn't copied into every record.
+_RECORDED_ENV_VARS = ("PATH", "HOME", "SHELL", "NODE_ENV", "PYTHON_PATH", "JAVA_HOME")
+
+
+def _recorded_environment(env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Return the recorded subset of env (default: os.environ)."""
+    source = os.environ if env is None else env
+    return {key: source[key] for key in _RECORDED_ENV_VARS if key in source}
+
+
+async def _read_tail(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Read stream to EOF, keeping at most its last limit bytes.
+    
+    When output is cut, the partial first line is dropped as well.
+    """
+    tail = bytearray()
+    truncated = False
+    while True:
+        chunk = await stream.read(64 * 1024)
+        if not chunk:
+            break
+        tail += chunk
+        # Trim only once the buffer doubles so the cost stays linear
+        if len(tail) > 2 * limit:
+            del tail[:-limit]
+            truncated = True
+    
+    if len(tail) > limit:
+        del tail[:-limit]
+        truncated = True
+    if truncated:
+        del tail[:tail.find(b"\n") + 1]
+    return bytes(tail)
+
+
 @dataclass
 class CommandResult:
     """Result of a command execution."""
@@ -37,12 +89,25 @@ class TerminalCollector(BaseCollector):
     
     def __init__(self, name: str = "terminal"):
         super().__init__(name)
-        self._collected_errors: List[TerminalError] = []
+        self._collected_errors: Deque[TerminalError] = deque()
         self._error_patterns = self._load_error_patterns()
+        # All patterns as one alternation so text is scanned once
+        self._error_re = re.compile("|".join(
+            f"(?:{pattern})"
+            for patterns in self._error_patterns.values()
+            for pattern in patterns
+        ))
         self._monitoring_active = False
         self._shell_wrapper_active = False
-        self._command_history: List[CommandResult] = []
         self._max_history = 1000
+        # Bounded history; appends past the limit drop the oldest entry in O(1)
+        self._command_history: Deque[CommandResult] = deque(maxlen=self._max_history)
+        # Failed entries of _command_history, kept in step with it
+        self._failed_history: Deque[CommandResult] = deque()
+        # Per-stream cap on captured command output; only the tail is kept
+        self._max_output_bytes = 1024 * 1024
+        # Wake events for active monitor_command_file loops
+        self._file_change_events: Set[asyncio.Event] = set()
         
         # Callbacks for real-time error notification
         self._error_callbacks: List[Callable[[TerminalError], None]] = []
@@ -70,22 +135,31 @@ class TerminalCollector(BaseCollector):
         self._monitoring_active = False
         self._shell_wrapper_active = False
         
+        # Wake file monitors so they can exit
+        for changed in self._file_change_events:
+            changed.set()
+        
         logger.info("Terminal error collection stopped")
     
     async def get_collected_errors(self) -> List[TerminalError]:
         """Get all collected errors since last retrieval."""
-        errors = self._collected_errors.copy()
-        self._collected_errors.clear()
-        return errors
+        errors = self._collected_errors
+        self._collected_errors = deque()
+        return list(errors)
     
     async def execute_command(
         self, 
         command: str, 
         working_dir: Optional[str] = None,
         timeout: Optional[float] = None,
-        capture_errors: bool = True
+        capture_errors: bool = True,
+        env: Optional[Dict[str, str]] = None
     ) -> CommandResult:
-        """Execute a command and capture any errors."""
+        """Execute a command and capture any errors.
+        
+        env replaces the process environment for the command; by default the
+        current environment is inherited.
+        """
         start_time = time.time()
         working_directory = working_dir or os.getcwd()
         
@@ -96,9 +170,6 @@ class TerminalCollector(BaseCollector):
             else:
                 cmd_args = command
             
-            # Set up process environment
-            env = os.environ.copy()
-            
             # Execute command
             process = await asyncio.create_subprocess_exec(
                 *cmd_args,
@@ -109,11 +180,15 @@ class TerminalCollector(BaseCollector):
             )
             
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(), 
+                # Stream both pipes, keeping only the tail of very large output
+                stdout_bytes, stderr_bytes, exit_code = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_tail(process.stdout, self._max_output_bytes),
+                        _read_tail(process.stderr, self._max_output_bytes),
+                        process.wait()
+                    ),
                     timeout=timeout
                 )
-                exit_code = process.returncode
             except asyncio.TimeoutError:
                 process.kill()
                 await process.wait()
@@ -135,7 +210,7 @@ class TerminalCollector(BaseCollector):
                 stderr=stderr,
                 execution_time=execution_time,
                 working_directory=working_directory,
-                environment=env,
+                environment=_recorded_environment(env),
                 timestamp=datetime.utcnow()
             )
             
@@ -143,7 +218,8 @@ class TerminalCollector(BaseCollector):
             self._add_to_history(result)
             
             # Check for errors if capture is enabled
-            if capture_errors and (exit_code != 0 or self._has_error_patterns(stderr)):
+            # _create_error_from_result applies the stderr pattern check itself
+            if capture_errors:
                 error = await self._create_error_from_result(result)
                 if error:
                     await self._collect_error(error)
@@ -162,7 +238,7 @@ class TerminalCollector(BaseCollector):
                 stderr=f"Execution failed: {str(e)}",
                 execution_time=execution_time,
                 working_directory=working_directory,
-                environment=os.environ.copy(),
+                environment=_recorded_environment(env),
                 timestamp=datetime.utcnow()
             )
             
@@ -175,35 +251,69 @@ class TerminalCollector(BaseCollector):
     
     async def monitor_command_file(self, file_path: str) -> None:
         """Monitor a file for command execution logs."""
-        file_path_obj = Path(file_path)
+        file_path_obj = Path(file_path).resolve()
         if not file_path_obj.exists():
             logger.warning(f"Command log file does not exist: {file_path}")
             return
         
         logger.info(f"Monitoring command log file: {file_path}")
         
-        # Get initial file size
-        last_size = file_path_obj.stat().st_size
+        # One handle for the whole session, positioned at the current end
+        log_file = open(file_path_obj, 'rb')
+        log_file.seek(0, os.SEEK_END)
+        pending = b""
+        changed = asyncio.Event()
+        self._file_change_events.add(changed)
+        observer = start_file_watcher(file_path_obj, changed)
         
-        while self._monitoring_active:
-            try:
-                current_size = file_path_obj.stat().st_size
-                
-                if current_size > last_size:
-                    # Read new content
-                    with open(file_path_obj, 'r', encoding='utf-8', errors='replace') as f:
-                        f.seek(last_size)
-                        new_content = f.read()
+        try:
+            while self._monitoring_active:
+                try:
+                    # Start over if the file was truncated
+                    if os.fstat(log_file.fileno()).st_size < log_file.tell():
+                        log_file.seek(0)
+                        pending = b""
                     
-                    # Process new log entries
-                    await self._process_log_content(new_content)
-                    last_size = current_size
-                
-                await asyncio.sleep(1)  # Check every second
-                
-            except Exception as e:
-                logger.error(f"Error monitoring command file: {e}")
-                await asyncio.sleep(5)  # Wait longer on error
+                    data = pending + log_file.read()
+                    
+                    # Follow the path to a new file after rename-style rotation,
+                    # once whatever was left in the old one has been read
+                    try:
+                        rotated = os.stat(file_path_obj).st_ino != os.fstat(log_file.fileno()).st_ino
+                    except FileNotFoundError:
+                        rotated = False
+                    if rotated:
+                        # The old file is finished, so its last line is complete
+                        if data and not data.endswith(b"\n"):
+                            data += b"\n"
+                        log_file.close()
+                        log_file = open(file_path_obj, 'rb')
+                        data += log_file.read()
+                    
+                    # Leave a partially written line for the next pass
+                    end = data.rfind(b"\n") + 1
+                    pending = data[end:]
+                    if end:
+                        await self._process_log_content(
+                            data[:end].decode('utf-8', errors='replace')
+                        )
+                    
+                    # Sleep until the file changes, polling every second as a
+                    # fallback for missing watchers and missed events
+                    try:
+                        await asyncio.wait_for(changed.wait(), 1)
+                    except asyncio.TimeoutError:
+                        pass
+                    changed.clear()
+                    
+                except Exception as e:
+                    logger.error(f"Error monitoring command file: {e}")
+                    await asyncio.sleep(5)  # Wait longer on error
+        finally:
+            self._file_change_events.discard(changed)
+            if observer is not None:
+                observer.stop()
+            log_file.close()
     
     def add_error_callback(self, callback: Callable[[TerminalError], None]) -> None:
         """Add a callback to be notified of new errors."""
@@ -216,15 +326,13 @@ class TerminalCollector(BaseCollector):
     
     async def get_command_history(self, limit: int = 100) -> List[CommandResult]:
         """Get recent command execution history."""
-        return self._command_history[-limit:]
+        history = self._command_history
+        return list(islice(history, max(0, len(history) - limit), None))
     
     async def get_failed_commands(self, limit: int = 50) -> List[CommandResult]:
         """Get recent failed commands."""
-        failed_commands = [
-            cmd for cmd in self._command_history 
-            if cmd.exit_code != 0
-        ]
-        return failed_commands[-limit:]
+        failed = self._failed_history
+        return list(islice(failed, max(0, len(failed) - limit), None))
     
     async def health_check(self) -> bool:
         """Check if the terminal collector is healthy."""
@@ -237,7 +345,10 @@ class TerminalCollector(BaseCollector):
             return False
     
     def _load_error_patterns(self) -> Dict[str, List[str]]:
-        """Load common error patterns for different tools."""
+        """Load common error patterns for different tools.
+        
+        Patterns are lowercase and match against lowercased text.
+        """
         return {
             "compilation": [
                 r"error:",
@@ -286,19 +397,17 @@ class TerminalCollector(BaseCollector):
     
     def _has_error_patterns(self, text: str) -> bool:
         """Check if text contains known error patterns."""
-        import re
-        text_lower = text.lower()
-        
-        for category, patterns in self._error_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    return True
-        
-        return False
+        return bool(text) and self._error_re.search(text.lower()) is not None
     
     async def _create_error_from_result(self, result: CommandResult) -> Optional[TerminalError]:
         """Create a TerminalError from a CommandResult."""
-        if result.exit_code == 0 and not self._has_error_patterns(result.stderr):
+        # A clean success needs no scan at all
+        if result.exit_code == 0 and not result.stderr:
+            return None
+        
+        # Lowercase stderr once for both the pattern check and severity
+        stderr_lower = result.stderr.lower()
+        if result.exit_code == 0 and not self._error_re.search(stderr_lower):
             return None
         
         # Determine error message
@@ -310,7 +419,7 @@ class TerminalCollector(BaseCollector):
             return None
         
         # Determine severity based on exit code and patterns
-        severity = self._determine_error_severity(result)
+        severity = self._determine_error_severity(result, stderr_lower)
         
         # Create terminal error
         error = TerminalError(
@@ -327,20 +436,21 @@ class TerminalCollector(BaseCollector):
         
         return error
     
-    def _determine_error_severity(self, result: CommandResult) -> ErrorSeverity:
+    def _determine_error_severity(
+        self,
+        result: CommandResult,
+        stderr_lower: Optional[str] = None
+    ) -> ErrorSeverity:
         """Determine error severity based on command result."""
-        stderr_lower = result.stderr.lower()
+        if stderr_lower is None:
+            stderr_lower = result.stderr.lower()
         
         # Critical errors
-        if any(pattern in stderr_lower for pattern in [
-            "fatal", "critical", "segmentation fault", "core dumped", "out of memory"
-        ]):
+        if _CRITICAL_STDERR.search(stderr_lower):
             return ErrorSeverity.CRITICAL
         
         # High severity errors
-        if any(pattern in stderr_lower for pattern in [
-            "error:", "compilation failed", "build failed", "test failed"
-        ]) or result.exit_code in [1, 2]:
+        if _HIGH_STDERR.search(stderr_lower) or result.exit_code in [1, 2]:
             return ErrorSeverity.HIGH
         
         # Medium severity for other non-zero exit codes
@@ -348,9 +458,7 @@ class TerminalCollector(BaseCollector):
             return ErrorSeverity.MEDIUM
         
         # Low severity for warnings in stderr
-        if any(pattern in stderr_lower for pattern in [
-            "warning", "deprecated", "notice"
-        ]):
+        if _LOW_STDERR.search(stderr_lower):
             return ErrorSeverity.LOW
         
         return ErrorSeverity.MEDIUM
@@ -359,22 +467,31 @@ class TerminalCollector(BaseCollector):
         """Collect a terminal error."""
         self._collected_errors.append(error)
         
-        # Notify callbacks
+        # Notify callbacks on later loop iterations so a slow callback
+        # does not hold up collection
+        loop = asyncio.get_running_loop()
         for callback in self._error_callbacks:
-            try:
-                callback(error)
-            except Exception as e:
-                logger.error(f"Error in error callback: {e}")
+            loop.call_soon(self._run_callback, callback, error)
         
         logger.debug(f"Collected terminal error: {error.message[:100]}...")
     
+    def _run_callback(self, callback: Callable[[TerminalError], None], error: TerminalError) -> None:
+        """Invoke a callback, logging rather than propagating its errors."""
+        try:
+            callback(error)
+        except Exception as e:
+            logger.error(f"Error in error callback: {e}")
+    
     def _add_to_history(self, result: CommandResult) -> None:
         """Add command result to history."""
-        self._command_history.append(result)
-        
-        # Maintain history size limit
-        if len(self._command_history) > self._max_history:
-            self._command_history = self._command_history[-self._max_history:]
+        history = self._command_history
+        # Drop the failed entry that is about to fall out of the history
+        if (len(history) == history.maxlen and self._failed_history
+                and history[0] is self._failed_history[0]):
+            self._failed_history.popleft()
+        history.append(result)
+        if result.exit_code != 0:
+            self._failed_history.append(result)
     
     async def _monitor_shell_integration(self) -> None:
         """Monitor for shell integration opportunities."""
@@ -401,6 +518,9 @@ class TerminalCollector(BaseCollector):
     async def _process_log_content(self, content: str) -> None:
         """Process new log file content for errors."""
         lines = content.strip().split('\n')
+        # Lines read in one pass share the working directory and timestamp
+        working_directory = os.getcwd()
+        timestamp = datetime.utcnow()
         
         for line in lines:
             if not line.strip():
@@ -414,11 +534,11 @@ class TerminalCollector(BaseCollector):
                     message=line.strip(),
                     command="unknown",
                     exit_code=1,
-                    working_directory=os.getcwd(),
+                    working_directory=working_directory,
                     environment={},
                     stderr_output=line,
                     stdout_output="",
-                    timestamp=datetime.utcnow()
+                    timestamp=timestamp
                 )
                 
                 await self._collect_error(error)
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Configuration schema definitions using Pydantic."""
 
-from typing import Dict, List, Optional, Set
-from pydantic import BaseModel, Field, validator
+from typing import Dict, FrozenSet, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
 
@@ -16,6 +16,8 @@ class LogLevel(str, Enum):
 
 class OpenRouterConfig(BaseModel):
     """OpenRouter API configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     api_key: str = Field(..., description="OpenRouter API key")
     base_url: str = Field(
         default="https://openrouter.ai/api/v1",
@@ -30,7 +32,8 @@ class OpenRouterConfig(BaseModel):
     timeout: int = Field(default=30, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     
-    @validator('api_key')
+    @field_validator('api_key')
+    @classmethod
     def validate_api_key(cls, v):
         if not v or not v.strip():
             raise ValueError("OpenRouter API key cannot be empty")
@@ -39,8 +42,10 @@ class OpenRouterConfig(BaseModel):
 
 class CollectionPreferences(BaseModel):
     """Error collection preferences and filtering."""
-    enabled_sources: Set[str] = Field(
-        default={"browser", "terminal"},
+    model_config = ConfigDict(frozen=True)
+    
+    enabled_sources: FrozenSet[str] = Field(
+        default=frozenset({"browser", "terminal"}),
         description="Enabled error sources"
     )
     ignored_error_patterns: List[str] = Field(
@@ -71,6 +76,8 @@ class CollectionPreferences(BaseModel):
 
 class StorageConfig(BaseModel):
     """Storage configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     data_directory: str = Field(
         default="~/.error-collector-mcp",
         description="Directory for storing error data"
@@ -91,6 +98,8 @@ class StorageConfig(BaseModel):
 
 class ServerConfig(BaseModel):
     """MCP server configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     host: str = Field(default="localhost", description="Server host")
     port: int = Field(default=8000, description="Server port")
     log_level: LogLevel = Field(default=LogLevel.INFO, description="Logging level")
@@ -103,11 +112,14 @@ class ServerConfig(BaseModel):
 
 class Config(BaseModel):
     """Main configuration model."""
+    model_config = ConfigDict(
+        env_prefix="ERROR_COLLECTOR_",
+        env_nested_delimiter="__",
+        frozen=True,
+        extra="ignore"
+    )
+    
     openrouter: OpenRouterConfig
     collection: CollectionPreferences = Field(default_factory=CollectionPreferences)
     storage: StorageConfig = Field(default_factory=StorageConfig)
     server: ServerConfig = Field(default_factory=ServerConfig)
-    
-    class Config:
-        env_prefix = "ERROR_COLLECTOR_"
-        env_nested_delimiter = "__"
\ No newline at end of file
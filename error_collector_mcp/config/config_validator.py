@@ -2,13 +2,34 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Pattern, Tuple
 from urllib.parse import urlparse
 
 from .config_schema import Config, OpenRouterConfig, CollectionPreferences
 
 
+# http(s) URL with a host; anything else goes through urlparse
+_HTTP_URL_RE = re.compile(r"https?://[^/?#\s]+")
+
+# Whether this process may bind privileged ports, resolved once
+try:
+    _IS_ROOT = os.geteuid() == 0
+except AttributeError:  # pragma: no cover - Windows has no privileged ports
+    _IS_ROOT = True
+
+# (keywords that must all appear in an issue, suggested fix); first match wins
+_FIX_SUGGESTIONS = (
+    (("API key", "invalid"), "Get a valid API key from https://openrouter.ai/"),
+    (("base URL",), "Use the default OpenRouter URL: https://openrouter.ai/api/v1"),
+    (("model name",), "Use format: provider/model-name, e.g., 'meta-llama/llama-3.1-8b-instruct:free'"),
+    (("regex pattern",), "Check regex syntax at https://regex101.com/"),
+    (("directory", "permission"), "Create directory with: mkdir -p ~/.error-collector-mcp"),
+    (("port", "privileges"), "Use a port above 1024 or run with sudo"),
+)
+
+
 class ConfigValidator:
     """Validates configuration values and provides helpful error messages."""
     
@@ -22,12 +43,13 @@ class ConfigValidator:
             issues.append("OpenRouter API key appears to be invalid (too short)")
         
         # Validate base URL
-        try:
-            parsed_url = urlparse(config.base_url)
-            if not parsed_url.scheme or not parsed_url.netloc:
-                issues.append(f"Invalid OpenRouter base URL: {config.base_url}")
-        except Exception:
-            issues.append(f"Malformed OpenRouter base URL: {config.base_url}")
+        if not _HTTP_URL_RE.match(config.base_url):
+            try:
+                parsed_url = urlparse(config.base_url)
+                if not parsed_url.scheme or not parsed_url.netloc:
+                    issues.append(f"Invalid OpenRouter base URL: {config.base_url}")
+            except Exception:
+                issues.append(f"Malformed OpenRouter base URL: {config.base_url}")
         
         # Validate model name format
         if not config.model or "/" not in config.model:
@@ -61,10 +83,9 @@ class ConfigValidator:
         
         # Validate regex patterns
         for pattern in prefs.ignored_error_patterns:
-            try:
-                re.compile(pattern)
-            except re.error as e:
-                issues.append(f"Invalid regex pattern '{pattern}': {e}")
+            compiled, error = ConfigValidator.compile_pattern(pattern)
+            if compiled is None:
+                issues.append(f"Invalid regex pattern '{pattern}': {error}")
         
         # Validate numeric ranges
         if prefs.max_errors_per_minute <= 0 or prefs.max_errors_per_minute > 10000:
@@ -75,6 +96,18 @@ class ConfigValidator:
         
         return issues
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def compile_pattern(pattern: str, flags: int = 0) -> Tuple[Optional[Pattern[str]], Optional[str]]:
+        """Compile a user-supplied regex once per (pattern, flags).
+        
+        Returns (compiled, None) on success or (None, error message) on failure.
+        """
+        try:
+            return re.compile(pattern, flags), None
+        except re.error as e:
+            return None, str(e)
+    
     @staticmethod
     def validate_storage_config(storage_config) -> List[str]:
         """Validate storage configuration and return list of issues."""
@@ -115,7 +148,7 @@ class ConfigValidator:
             issues.append(f"Server port should be between 1 and 65535, got {server_config.port}")
         
         # Check if port is available (basic check)
-        if server_config.port < 1024 and os.getuid() != 0:
+        if server_config.port < 1024 and not _IS_ROOT:
             issues.append(f"Port {server_config.port} requires root privileges")
         
         # Validate concurrent requests
@@ -152,20 +185,12 @@ class ConfigValidator:
     @staticmethod
     def suggest_fixes(issues: List[str]) -> List[str]:
         """Suggest fixes for common configuration issues."""
-        suggestions = []
+        suggestions: Dict[str, None] = {}  # ordered set
         
         for issue in issues:
-            if "API key" in issue and "invalid" in issue:
-                suggestions.append("Get a valid API key from https://openrouter.ai/")
-            elif "base URL" in issue:
-                suggestions.append("Use the default OpenRouter URL: https://openrouter.ai/api/v1")
-            elif "model name" in issue:
-                suggestions.append("Use format: provider/model-name, e.g., 'meta-llama/llama-3.1-8b-instruct:free'")
-            elif "regex pattern" in issue:
-                suggestions.append("Check regex syntax at https://regex101.com/")
-            elif "directory" in issue and "permission" in issue:
-                suggestions.append("Create directory with: mkdir -p ~/.error-collector-mcp")
-            elif "port" in issue and "privileges" in issue:
-                suggestions.append("Use a port above 1024 or run with sudo")
-        
-        return list(set(suggestions))  # Remove duplicates
\ No newline at end of file
+            for keywords, suggestion in _FIX_SUGGESTIONS:
+                if all(keyword in issue for keyword in keywords):
+                    suggestions[suggestion] = None
+                    break
+        
+        return list(suggestions)
@@ -2,14 +2,22 @@
 
 import asyncio
 import logging
+import sys
 import time
+from collections import Counter, deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 from .services import ErrorManager
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is a declared dependency
+    psutil = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +30,32 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Rank used to pick the worst status; unknown checks never raise the overall status
+_SEVERITY: Dict[HealthStatus, int] = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.UNKNOWN: 0,
+    HealthStatus.WARNING: 1,
+    HealthStatus.CRITICAL: 2
+}
+
+# dataclass slots are only available from Python 3.10
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _Stopwatch:
+    """Whole milliseconds elapsed on the monotonic clock since creation."""
+    
+    __slots__ = ("_start",)
+    
+    def __init__(self) -> None:
+        self._start = time.perf_counter_ns()
+    
+    @property
+    def ms(self) -> int:
+        return (time.perf_counter_ns() - self._start) // 1_000_000
+
+
+@dataclass(frozen=True, **_SLOTS)
 class HealthCheck:
     """Individual health check result."""
     name: str
@@ -31,9 +64,24 @@ class HealthCheck:
     timestamp: datetime = field(default_factory=datetime.utcnow)
     duration_ms: int = 0
     details: Dict[str, Any] = field(default_factory=dict)
+    # Serialized form, built on first to_dict(); results never change
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        if self._dict is None:
+            object.__setattr__(self, "_dict", {
+                "name": self.name,
+                "status": self.status.value,
+                "message": self.message,
+                "timestamp": self.timestamp.isoformat(),
+                "duration_ms": self.duration_ms,
+                "details": self.details
+            })
+        return dict(self._dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SystemHealth:
     """Overall system health status."""
     overall_status: HealthStatus
@@ -46,34 +94,23 @@ class SystemHealth:
         self.checks.append(check)
         
         # Update overall status based on worst check
-        if check.status == HealthStatus.CRITICAL:
-            self.overall_status = HealthStatus.CRITICAL
-        elif check.status == HealthStatus.WARNING and self.overall_status != HealthStatus.CRITICAL:
-            self.overall_status = HealthStatus.WARNING
+        if _SEVERITY[check.status] > _SEVERITY[self.overall_status]:
+            self.overall_status = check.status
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
+        status_counts = Counter(check.status for check in self.checks)
         return {
             "overall_status": self.overall_status.value,
             "timestamp": self.timestamp.isoformat(),
             "uptime_seconds": self.uptime_seconds,
-            "checks": [
-                {
-                    "name": check.name,
-                    "status": check.status.value,
-                    "message": check.message,
-                    "timestamp": check.timestamp.isoformat(),
-                    "duration_ms": check.duration_ms,
-                    "details": check.details
-                }
-                for check in self.checks
-            ],
+            "checks": [check.to_dict() for check in self.checks],
             "summary": {
                 "total_checks": len(self.checks),
-                "healthy": len([c for c in self.checks if c.status == HealthStatus.HEALTHY]),
-                "warnings": len([c for c in self.checks if c.status == HealthStatus.WARNING]),
-                "critical": len([c for c in self.checks if c.status == HealthStatus.CRITICAL]),
-                "unknown": len([c for c in self.checks if c.status == HealthStatus.UNKNOWN])
+                "healthy": status_counts[HealthStatus.HEALTHY],
+                "warnings": status_counts[HealthStatus.WARNING],
+                "critical": status_counts[HealthStatus.CRITICAL],
+                "unknown": status_counts[HealthStatus.UNKNOWN]
             }
         }
 
@@ -85,8 +122,20 @@ class HealthMonitor:
         self.error_manager = error_manager
         self.start_time = time.time()
         self._monitoring_active = False
-        self._health_history: List[SystemHealth] = []
         self._max_history = 100
+        # Bounded history; appends past the limit drop the oldest entry in O(1)
+        self._health_history: Deque[SystemHealth] = deque(maxlen=self._max_history)
+        # Trend aggregates over the most recent checks, updated per append
+        self._trend_window: Deque[SystemHealth] = deque(maxlen=10)
+        self._trend_counts: Counter = Counter()
+        self._trend_changes = 0
+        
+        # Resource readings are reused for checks within this many seconds
+        self._resource_ttl = 1.0
+        self._resource_snapshot: Optional[Tuple[float, Any, Any, float]] = None
+        if psutil is not None:
+            # Prime the CPU counter so later non-blocking reads have a baseline
+            psutil.cpu_percent(interval=None)
     
     async def perform_health_check(self) -> SystemHealth:
         """Perform comprehensive health check."""
@@ -95,30 +144,56 @@ class HealthMonitor:
         
         # Check error manager
         if self.error_manager:
-            await self._check_error_manager(health)
-            await self._check_storage_systems(health)
-            await self._check_collectors(health)
-            await self._check_ai_summarizer(health)
+            checks = [
+                self._check_error_manager,
+                self._check_storage_systems,
+                self._check_collectors,
+                self._check_ai_summarizer
+            ]
         else:
             health.add_check(HealthCheck(
                 name="error_manager",
                 status=HealthStatus.CRITICAL,
                 message="Error manager not initialized"
             ))
+            checks = []
         
         # Check system resources
-        await self._check_system_resources(health)
+        checks.append(self._check_system_resources)
+        
+        # Run the independent checks concurrently, each into its own partial
+        # result, then merge them in a fixed order
+        partials = [SystemHealth(overall_status=HealthStatus.HEALTHY) for _ in checks]
+        await asyncio.gather(*(check(partial) for check, partial in zip(checks, partials)))
+        for partial in partials:
+            for check_result in partial.checks:
+                health.add_check(check_result)
         
         # Store in history
         self._health_history.append(health)
-        if len(self._health_history) > self._max_history:
-            self._health_history.pop(0)
+        self._record_trend(health)
         
         return health
     
+    def _record_trend(self, health: SystemHealth) -> None:
+        """Slide the trend window forward by one health snapshot."""
+        window = self._trend_window
+        status = health.overall_status
+        
+        if len(window) == window.maxlen:
+            evicted = window.popleft()
+            self._trend_counts[evicted.overall_status] -= 1
+            if window and window[0].overall_status is not evicted.overall_status:
+                self._trend_changes -= 1
+        
+        if window and window[-1].overall_status is not status:
+            self._trend_changes += 1
+        window.append(health)
+        self._trend_counts[status] += 1
+    
     async def _check_error_manager(self, health: SystemHealth) -> None:
         """Check error manager health."""
-        start_time = time.time()
+        timer = _Stopwatch()
         
         try:
             if not self.error_manager._is_running:
@@ -126,7 +201,7 @@ class HealthMonitor:
                     name="error_manager",
                     status=HealthStatus.CRITICAL,
                     message="Error manager is not running",
-                    duration_ms=int((time.time() - start_time) * 1000)
+                    duration_ms=timer.ms
                 ))
                 return
             
@@ -149,7 +224,7 @@ class HealthMonitor:
                 name="error_manager",
                 status=status,
                 message=message,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=timer.ms,
                 details={
                     "errors_processed": processing_rate,
                     "summaries_generated": manager_stats["summaries_generated"],
@@ -162,12 +237,12 @@ class HealthMonitor:
                 name="error_manager",
                 status=HealthStatus.CRITICAL,
                 message=f"Error manager check failed: {str(e)}",
-                duration_ms=int((time.time() - start_time) * 1000)
+                duration_ms=timer.ms
             ))
     
     async def _check_storage_systems(self, health: SystemHealth) -> None:
         """Check storage system health."""
-        start_time = time.time()
+        timer = _Stopwatch()
         
         try:
             # Check error store
@@ -186,7 +261,7 @@ class HealthMonitor:
                 name="error_store",
                 status=status,
                 message=message,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=timer.ms,
                 details=error_stats
             ))
             
@@ -205,7 +280,7 @@ class HealthMonitor:
                 name="summary_store",
                 status=status,
                 message=message,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=timer.ms,
                 details=summary_stats
             ))
             
@@ -214,19 +289,19 @@ class HealthMonitor:
                 name="storage_systems",
                 status=HealthStatus.CRITICAL,
                 message=f"Storage check failed: {str(e)}",
-                duration_ms=int((time.time() - start_time) * 1000)
+                duration_ms=timer.ms
             ))
     
     async def _check_collectors(self, health: SystemHealth) -> None:
         """Check collector health."""
-        start_time = time.time()
+        timer = _Stopwatch()
         
         try:
             healthy_collectors = 0
             total_collectors = len(self.error_manager.collectors)
             
             for name, collector in self.error_manager.collectors.items():
-                collector_start = time.time()
+                collector_timer = _Stopwatch()
                 
                 try:
                     collector_healthy = await collector.health_check()
@@ -243,7 +318,7 @@ class HealthMonitor:
                         name=f"collector_{name}",
                         status=status,
                         message=message,
-                        duration_ms=int((time.time() - collector_start) * 1000),
+                        duration_ms=collector_timer.ms,
                         details={
                             "collecting": collector.is_collecting,
                             "healthy": collector_healthy
@@ -255,7 +330,7 @@ class HealthMonitor:
                         name=f"collector_{name}",
                         status=HealthStatus.CRITICAL,
                         message=f"Collector {name} check failed: {str(e)}",
-                        duration_ms=int((time.time() - collector_start) * 1000)
+                        duration_ms=collector_timer.ms
                     ))
             
             # Overall collector health
@@ -276,7 +351,7 @@ class HealthMonitor:
                 name="collectors_overall",
                 status=overall_status,
                 message=overall_message,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=timer.ms,
                 details={
                     "total_collectors": total_collectors,
                     "healthy_collectors": healthy_collectors
@@ -288,12 +363,12 @@ class HealthMonitor:
                 name="collectors",
                 status=HealthStatus.CRITICAL,
                 message=f"Collector check failed: {str(e)}",
-                duration_ms=int((time.time() - start_time) * 1000)
+                duration_ms=timer.ms
             ))
     
     async def _check_ai_summarizer(self, health: SystemHealth) -> None:
         """Check AI summarizer health."""
-        start_time = time.time()
+        timer = _Stopwatch()
         
         try:
             if not self.error_manager.ai_summarizer._is_running:
@@ -301,7 +376,7 @@ class HealthMonitor:
                     name="ai_summarizer",
                     status=HealthStatus.CRITICAL,
                     message="AI summarizer is not running",
-                    duration_ms=int((time.time() - start_time) * 1000)
+                    duration_ms=timer.ms
                 ))
                 return
             
@@ -332,7 +407,7 @@ class HealthMonitor:
                 name="ai_summarizer",
                 status=status,
                 message=message,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=timer.ms,
                 details=details
             ))
             
@@ -341,27 +416,27 @@ class HealthMonitor:
                 name="ai_summarizer",
                 status=HealthStatus.CRITICAL,
                 message=f"AI summarizer check failed: {str(e)}",
-                duration_ms=int((time.time() - start_time) * 1000)
+                duration_ms=timer.ms
             ))
     
     async def _check_system_resources(self, health: SystemHealth) -> None:
         """Check system resource usage."""
-        start_time = time.time()
+        timer = _Stopwatch()
+        
+        if psutil is None:
+            health.add_check(HealthCheck(
+                name="system_resources",
+                status=HealthStatus.UNKNOWN,
+                message="psutil not available for resource monitoring",
+                duration_ms=timer.ms
+            ))
+            return
         
         try:
-            import psutil
-            
-            # Check memory usage
-            memory = psutil.virtual_memory()
+            memory, disk, cpu_percent = self._sample_resources()
             memory_percent = memory.percent
-            
-            # Check disk usage
-            disk = psutil.disk_usage('/')
             disk_percent = (disk.used / disk.total) * 100
             
-            # Check CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            
             # Determine status based on resource usage
             status = HealthStatus.HEALTHY
             warnings = []
@@ -392,7 +467,7 @@ class HealthMonitor:
                 name="system_resources",
                 status=status,
                 message=message,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=timer.ms,
                 details={
                     "memory_percent": memory_percent,
                     "disk_percent": disk_percent,
@@ -402,24 +477,33 @@ class HealthMonitor:
                 }
             ))
             
-        except ImportError:
-            health.add_check(HealthCheck(
-                name="system_resources",
-                status=HealthStatus.UNKNOWN,
-                message="psutil not available for resource monitoring",
-                duration_ms=int((time.time() - start_time) * 1000)
-            ))
         except Exception as e:
             health.add_check(HealthCheck(
                 name="system_resources",
                 status=HealthStatus.WARNING,
                 message=f"Resource check failed: {str(e)}",
-                duration_ms=int((time.time() - start_time) * 1000)
+                duration_ms=timer.ms
             ))
     
+    def _sample_resources(self) -> Tuple[Any, Any, float]:
+        """Read memory, disk and CPU usage, reusing a reading younger than the TTL."""
+        now = time.monotonic()
+        snapshot = self._resource_snapshot
+        if snapshot is None or now - snapshot[0] > self._resource_ttl:
+            # CPU usage since the previous reading; never sleeps to sample
+            snapshot = (
+                now,
+                psutil.virtual_memory(),
+                psutil.disk_usage('/'),
+                psutil.cpu_percent(interval=None)
+            )
+            self._resource_snapshot = snapshot
+        return snapshot[1:]
+    
     def get_health_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent health check history."""
-        recent_history = self._health_history[-limit:] if self._health_history else []
+        history = self._health_history
+        recent_history = islice(history, max(0, len(history) - limit), None)
         return [health.to_dict() for health in recent_history]
     
     def get_health_trends(self) -> Dict[str, Any]:
@@ -427,26 +511,14 @@ class HealthMonitor:
         if len(self._health_history) < 2:
             return {"error": "Insufficient data for trend analysis"}
         
-        # Analyze trends over recent history
-        recent_checks = self._health_history[-10:]  # Last 10 checks
-        
-        # Count status changes
-        status_counts = {
-            HealthStatus.HEALTHY.value: 0,
-            HealthStatus.WARNING.value: 0,
-            HealthStatus.CRITICAL.value: 0,
-            HealthStatus.UNKNOWN.value: 0
-        }
-        
-        for health in recent_checks:
-            status_counts[health.overall_status.value] += 1
+        # Analyze trends over the last 10 checks, aggregated as they were recorded
+        recent_checks = self._trend_window
+        counts = self._trend_counts
+        status_counts = {status.value: counts[status] for status in HealthStatus}
         
         # Calculate stability
         latest_status = recent_checks[-1].overall_status
-        status_changes = sum(
-            1 for i in range(1, len(recent_checks))
-            if recent_checks[i].overall_status != recent_checks[i-1].overall_status
-        )
+        status_changes = self._trend_changes
         
         stability = "stable" if status_changes <= 1 else "unstable"
         
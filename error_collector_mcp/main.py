@@ -3,25 +3,80 @@
 import argparse
 import asyncio
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
-from .services.config_service import ConfigService
+from . import install_fast_loop
+
+
+# Printed in one write after the extensions are built
+_EXTENSION_INSTRUCTIONS = (
+    "\nInstallation instructions:\n"
+    "Chrome: Go to chrome://extensions/, enable Developer mode, click 'Load unpacked'\n"
+    "Firefox: Go to about:debugging, click 'This Firefox', click 'Load Temporary Add-on'"
+)
+
+# Listener thread that writes log records handed off by the event loop
+_log_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(log_level: str) -> None:
-    """Set up logging configuration."""
+    """Set up logging configuration.
+    
+    Records are queued by the calling thread and written to stdout and the
+    log file by a listener thread, so logging never blocks the event loop.
+    """
+    global _log_listener
+    
+    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    formatter = logging.Formatter(log_format)
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    # Batch file writes; errors still reach the file immediately, and
+    # stopping the listener flushes whatever is left
+    file_handler = logging.FileHandler("error-collector-mcp.log")
+    file_handler.setFormatter(formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    
+    stop_logging()
+    log_queue: queue.Queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, buffered_file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    
+    # The queued record carries the rendered message; the listener's
+    # handlers apply the full format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler("error-collector-mcp.log")
-        ]
+        handlers=[queue_handler]
     )
 
 
+def stop_logging() -> None:
+    """Stop the logging listener, writing out any queued records."""
+    global _log_listener
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.flush()
+        _log_listener = None
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -79,6 +134,24 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Create packaged extension files"
     )
+    extension_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent manifest.json for readability"
+    )
+    extension_parser.add_argument(
+        "--package-only",
+        action="store_true",
+        help="Only create packaged files, without the unpacked extension directories"
+    )
+    extension_parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        default=9,
+        metavar="{0-9}",
+        help="DEFLATE level for packaged files (1 = fastest, 9 = smallest)"
+    )
     
     # MCP server command
     server_parser = subparsers.add_parser(
@@ -104,9 +177,11 @@ async def main() -> None:
         wrapper = ShellWrapper()
         try:
             install_path = wrapper.install_shell_integration(args.shell)
-            print(f"Shell integration installed to: {install_path}")
-            print("Please restart your terminal or source your shell configuration file.")
-            print(f"Log file location: {wrapper.log_file}")
+            print(
+                f"Shell integration installed to: {install_path}\n"
+                "Please restart your terminal or source your shell configuration file.\n"
+                f"Log file location: {wrapper.log_file}"
+            )
         except Exception as e:
             print(f"Installation failed: {e}")
             sys.exit(1)
@@ -115,31 +190,19 @@ async def main() -> None:
     # Handle browser extension command
     if args.command == "build-browser-extension":
         from .collectors.browser_extension import BrowserExtensionBuilder
-        builder = BrowserExtensionBuilder()
+        builder = BrowserExtensionBuilder(pretty_manifest=args.pretty)
         output_dir = Path(args.output_dir)
         
         try:
-            if args.browser in ["chrome", "all"]:
-                chrome_dir = builder.build_chrome_extension(output_dir / "chrome")
-                print(f"Chrome extension built in: {chrome_dir}")
-                
-                if args.package:
-                    package_file = output_dir / "error-collector-mcp-chrome.zip"
-                    builder.create_extension_package(chrome_dir, package_file)
-                    print(f"Chrome extension packaged: {package_file}")
-            
-            if args.browser in ["firefox", "all"]:
-                firefox_dir = builder.build_firefox_extension(output_dir / "firefox")
-                print(f"Firefox extension built in: {firefox_dir}")
-                
-                if args.package:
-                    package_file = output_dir / "error-collector-mcp-firefox.zip"
-                    builder.create_extension_package(firefox_dir, package_file)
-                    print(f"Firefox extension packaged: {package_file}")
+            browsers = ["chrome", "firefox"] if args.browser == "all" else [args.browser]
+            for message in builder.build_extensions(
+                browsers, output_dir, args.package, args.package_only, args.compress_level
+            ):
+                print(message)
             
-            print("\nInstallation instructions:")
-            print("Chrome: Go to chrome://extensions/, enable Developer mode, click 'Load unpacked'")
-            print("Firefox: Go to about:debugging, click 'This Firefox', click 'Load Temporary Add-on'")
+            # Loading unpacked needs the extension directories
+            if not args.package_only:
+                print(_EXTENSION_INSTRUCTIONS)
             
         except Exception as e:
             print(f"Extension build failed: {e}")
@@ -164,7 +227,9 @@ async def main() -> None:
             sys.exit(1)
         return
     
-    # Load configuration
+    # Load configuration (imported here so the other subcommands skip the
+    # services package and its dependencies)
+    from .services.config_service import ConfigService
     config_service = ConfigService()
     try:
         config = await config_service.load_config(args.config)
@@ -188,6 +253,7 @@ async def main() -> None:
 
 def cli_main() -> None:
     """CLI entry point wrapper."""
+    install_fast_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -195,6 +261,8 @@ def cli_main() -> None:
     except Exception as e:
         print(f"Fatal error: {e}")
         sys.exit(1)
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -2,40 +2,104 @@
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
-from fastmcp import FastMCP
-
-from .services import ErrorCollectorMCPService
-from .mcp_tools import ErrorQueryTool, ErrorSummaryTool, ErrorStatisticsTool
+if TYPE_CHECKING:
+    from .services import ErrorCollectorMCPService
+    from .mcp_tools import ErrorQueryTool, ErrorSummaryTool, ErrorStatisticsTool
 
 
 logger = logging.getLogger(__name__)
 
 
+# Input schemas for the utility tools, shared by every server instance
+_SERVER_STATUS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "include_details": {
+            "type": "boolean",
+            "description": "Include detailed component information",
+            "default": True
+        }
+    }
+}
+
+_SIMULATE_ERROR_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "error_type": {
+            "type": "string",
+            "enum": ["browser", "terminal"],
+            "description": "Type of error to simulate",
+            "default": "browser"
+        },
+        "count": {
+            "type": "integer",
+            "minimum": 1,
+            "maximum": 10,
+            "description": "Number of errors to simulate",
+            "default": 1
+        }
+    }
+}
+
+# Listing entries for the utility tools, shared by every tools listing
+_UTILITY_TOOL_INFO: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "get_server_status",
+        "description": "Get comprehensive server status and health information",
+        "category": "utility"
+    },
+    {
+        "name": "simulate_error",
+        "description": "Simulate errors for testing and demonstration purposes",
+        "category": "utility"
+    }
+)
+
+
 class ErrorCollectorMCPServer:
     """MCP server for Error Collector functionality."""
     
+    __slots__ = (
+        "config_path",
+        "data_directory",
+        "service",
+        "mcp",
+        "error_query_tool",
+        "error_summary_tool",
+        "error_statistics_tool",
+        "_available_tools_cache",
+        "_is_running"
+    )
+    
     def __init__(self, config_path: str, data_directory: Optional[Path] = None):
         self.config_path = config_path
         self.data_directory = data_directory
         
         # Core service
-        self.service: Optional[ErrorCollectorMCPService] = None
+        self.service: Optional["ErrorCollectorMCPService"] = None
         
-        # MCP server
+        # MCP server (FastMCP is imported here so importing this module stays cheap)
+        from fastmcp import FastMCP
         self.mcp = FastMCP("Error Collector MCP")
         
         # Tools
-        self.error_query_tool: Optional[ErrorQueryTool] = None
-        self.error_summary_tool: Optional[ErrorSummaryTool] = None
-        self.error_statistics_tool: Optional[ErrorStatisticsTool] = None
+        self.error_query_tool: Optional["ErrorQueryTool"] = None
+        self.error_summary_tool: Optional["ErrorSummaryTool"] = None
+        self.error_statistics_tool: Optional["ErrorStatisticsTool"] = None
+        
+        # Tool listing, built once the tools are registered
+        self._available_tools_cache: Optional[List[Dict[str, Any]]] = None
         
         self._is_running = False
     
     async def initialize(self) -> None:
         """Initialize the MCP server and all components."""
+        from .services import ErrorCollectorMCPService
+        from .mcp_tools import ErrorQueryTool, ErrorSummaryTool, ErrorStatisticsTool
+        
         try:
             # Initialize core service
             self.service = ErrorCollectorMCPService(self.config_path, self.data_directory)
@@ -94,7 +158,12 @@ class ErrorCollectorMCPServer:
     
     async def _register_mcp_tools(self) -> None:
         """Register all MCP tools with the server."""
+        # The tool objects are fixed once registered, so each handler calls
+        # a bound execute method captured here
+        
         # Register error query tool
+        query_execute = self.error_query_tool.execute
+        
         @self.mcp.tool(
             name=self.error_query_tool.name,
             description=self.error_query_tool.description,
@@ -102,9 +171,11 @@ class ErrorCollectorMCPServer:
         )
         async def query_errors(arguments: Dict[str, Any]) -> Dict[str, Any]:
             """Query and filter collected errors."""
-            return await self.error_query_tool.execute(arguments)
+            return await query_execute(arguments)
         
         # Register error summary tool
+        summary_execute = self.error_summary_tool.execute
+        
         @self.mcp.tool(
             name=self.error_summary_tool.name,
             description=self.error_summary_tool.description,
@@ -112,9 +183,11 @@ class ErrorCollectorMCPServer:
         )
         async def get_error_summary(arguments: Dict[str, Any]) -> Dict[str, Any]:
             """Get AI-generated error summaries and analysis."""
-            return await self.error_summary_tool.execute(arguments)
+            return await summary_execute(arguments)
         
         # Register error statistics tool
+        statistics_execute = self.error_statistics_tool.execute
+        
         @self.mcp.tool(
             name=self.error_statistics_tool.name,
             description=self.error_statistics_tool.description,
@@ -122,22 +195,13 @@ class ErrorCollectorMCPServer:
         )
         async def get_error_statistics(arguments: Dict[str, Any]) -> Dict[str, Any]:
             """Get comprehensive error statistics and analytics."""
-            return await self.error_statistics_tool.execute(arguments)
+            return await statistics_execute(arguments)
         
         # Register additional utility tools
         @self.mcp.tool(
             name="get_server_status",
             description="Get comprehensive server status and health information",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "include_details": {
-                        "type": "boolean",
-                        "description": "Include detailed component information",
-                        "default": True
-                    }
-                }
-            }
+            input_schema=_SERVER_STATUS_SCHEMA
         )
         async def get_server_status(arguments: Dict[str, Any]) -> Dict[str, Any]:
             """Get server status and health information."""
@@ -148,22 +212,19 @@ class ErrorCollectorMCPServer:
                         "error": "Service not initialized"
                     }
                 
-                status = await self.service.get_service_status()
-                
                 if not arguments.get("include_details", True):
-                    # Return simplified status
+                    # Return simplified status without gathering the details
+                    status = await self.service.get_service_status_summary()
                     return {
                         "success": True,
                         "data": {
                             "status": status["status"],
                             "healthy": status.get("healthy", False),
-                            "collectors_active": len([
-                                c for c in status.get("collectors", {}).values()
-                                if c.get("collecting", False)
-                            ]) if "collectors" in status else 0
+                            "collectors_active": status.get("collectors_active", 0)
                         }
                     }
                 
+                status = await self.service.get_service_status()
                 return {
                     "success": True,
                     "data": status
@@ -181,24 +242,7 @@ class ErrorCollectorMCPServer:
         @self.mcp.tool(
             name="simulate_error",
             description="Simulate errors for testing and demonstration purposes",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "error_type": {
-                        "type": "string",
-                        "enum": ["browser", "terminal"],
-                        "description": "Type of error to simulate",
-                        "default": "browser"
-                    },
-                    "count": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 10,
-                        "description": "Number of errors to simulate",
-                        "default": 1
-                    }
-                }
-            }
+            input_schema=_SIMULATE_ERROR_SCHEMA
         )
         async def simulate_error(arguments: Dict[str, Any]) -> Dict[str, Any]:
             """Simulate errors for testing purposes."""
@@ -212,15 +256,13 @@ class ErrorCollectorMCPServer:
                 error_type = arguments.get("error_type", "browser")
                 count = arguments.get("count", 1)
                 
-                simulated_errors = []
+                if error_type == "browser":
+                    simulate = self.service.simulate_browser_error
+                else:  # terminal
+                    simulate = self.service.simulate_terminal_error
                 
-                for i in range(count):
-                    if error_type == "browser":
-                        error_id = await self.service.simulate_browser_error()
-                    else:  # terminal
-                        error_id = await self.service.simulate_terminal_error()
-                    
-                    simulated_errors.append(error_id)
+                # Simulations are independent, so run them concurrently
+                simulated_errors = list(await asyncio.gather(*(simulate() for _ in range(count))))
                 
                 return {
                     "success": True,
@@ -240,10 +282,22 @@ class ErrorCollectorMCPServer:
                     }
                 }
         
+        self._available_tools_cache = self._build_available_tools()
+        
         logger.info("MCP tools registered successfully")
     
     async def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of available MCP tools."""
+        """Get list of available MCP tools.
+        
+        After registration the same cached list is returned on every call,
+        so callers must not modify it.
+        """
+        if self._available_tools_cache is not None:
+            return self._available_tools_cache
+        return self._build_available_tools()
+    
+    def _build_available_tools(self) -> List[Dict[str, Any]]:
+        """Build the list of available MCP tools."""
         tools = []
         
         if self.error_query_tool:
@@ -268,18 +322,7 @@ class ErrorCollectorMCPServer:
             })
         
         # Add utility tools
-        tools.extend([
-            {
-                "name": "get_server_status",
-                "description": "Get comprehensive server status and health information",
-                "category": "utility"
-            },
-            {
-                "name": "simulate_error",
-                "description": "Simulate errors for testing and demonstration purposes",
-                "category": "utility"
-            }
-        ])
+        tools.extend(_UTILITY_TOOL_INFO)
         
         return tools
 
@@ -319,4 +362,6 @@ if __name__ == "__main__":
     config_path = sys.argv[1] if len(sys.argv) > 1 else "config.json"
     
     # Run server
+    from . import install_fast_loop
+    install_fast_loop()
     asyncio.run(run_mcp_server(config_path))
\ No newline at end of file
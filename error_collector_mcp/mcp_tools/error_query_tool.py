@@ -9,6 +9,67 @@ from ..storage import ErrorFilters
 from ..models import ErrorSource, ErrorCategory, ErrorSeverity
 
 
+# Built once at import and shared by every tool instance
+_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "time_range": {
+            "type": "string",
+            "enum": ["1h", "6h", "24h", "7d", "30d", "all"],
+            "description": "Time range for error query",
+            "default": "24h"
+        },
+        "sources": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": ["browser", "terminal", "unknown"]
+            },
+            "description": "Filter by error sources"
+        },
+        "categories": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": ["syntax", "runtime", "network", "permission", "resource", "logic", "unknown"]
+            },
+            "description": "Filter by error categories"
+        },
+        "severities": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": ["low", "medium", "high", "critical"]
+            },
+            "description": "Filter by error severities"
+        },
+        "limit": {
+            "type": "integer",
+            "minimum": 1,
+            "maximum": 100,
+            "description": "Maximum number of errors to return",
+            "default": 20
+        },
+        "offset": {
+            "type": "integer",
+            "minimum": 0,
+            "description": "Number of errors to skip for pagination",
+            "default": 0
+        },
+        "include_context": {
+            "type": "boolean",
+            "description": "Include detailed error context in results",
+            "default": True
+        },
+        "group_similar": {
+            "type": "boolean",
+            "description": "Group similar errors together",
+            "default": False
+        }
+    }
+}
+
+
 class ErrorQueryTool:
     """MCP tool for querying and filtering collected errors."""
     
@@ -28,64 +89,7 @@ class ErrorQueryTool:
     @property
     def input_schema(self) -> Dict[str, Any]:
         """Input schema for the MCP tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "time_range": {
-                    "type": "string",
-                    "enum": ["1h", "6h", "24h", "7d", "30d", "all"],
-                    "description": "Time range for error query",
-                    "default": "24h"
-                },
-                "sources": {
-                    "type": "array",
-                    "items": {
-                        "type": "string",
-                        "enum": ["browser", "terminal", "unknown"]
-                    },
-                    "description": "Filter by error sources"
-                },
-                "categories": {
-                    "type": "array",
-                    "items": {
-                        "type": "string",
-                        "enum": ["syntax", "runtime", "network", "permission", "resource", "logic", "unknown"]
-                    },
-                    "description": "Filter by error categories"
-                },
-                "severities": {
-                    "type": "array",
-                    "items": {
-                        "type": "string",
-                        "enum": ["low", "medium", "high", "critical"]
-                    },
-                    "description": "Filter by error severities"
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 100,
-                    "description": "Maximum number of errors to return",
-                    "default": 20
-                },
-                "offset": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "description": "Number of errors to skip for pagination",
-                    "default": 0
-                },
-                "include_context": {
-                    "type": "boolean",
-                    "description": "Include detailed error context in results",
-                    "default": true
-                },
-                "group_similar": {
-                    "type": "boolean",
-                    "description": "Group similar errors together",
-                    "default": false
-                }
-            }
-        }
+        return _INPUT_SCHEMA
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the error query tool."""
@@ -9,6 +9,42 @@ from ..storage import ErrorFilters, SummaryFilters
 from ..models import ErrorSource, ErrorCategory, ErrorSeverity
 
 
+# Built once at import and shared by every tool instance
+_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "report_type": {
+            "type": "string",
+            "enum": ["overview", "trends", "patterns", "health", "detailed"],
+            "description": "Type of statistics report to generate",
+            "default": "overview"
+        },
+        "time_range": {
+            "type": "string",
+            "enum": ["1h", "6h", "24h", "7d", "30d", "all"],
+            "description": "Time range for statistics",
+            "default": "24h"
+        },
+        "grouping": {
+            "type": "string",
+            "enum": ["hour", "day", "week", "month"],
+            "description": "Time grouping for trend analysis",
+            "default": "hour"
+        },
+        "include_predictions": {
+            "type": "boolean",
+            "description": "Include trend predictions and forecasts",
+            "default": False
+        },
+        "include_recommendations": {
+            "type": "boolean",
+            "description": "Include actionable recommendations",
+            "default": True
+        }
+    }
+}
+
+
 class ErrorStatisticsTool:
     """MCP tool for error trends, patterns, and analytics."""
     
@@ -28,39 +64,7 @@ class ErrorStatisticsTool:
     @property
     def input_schema(self) -> Dict[str, Any]:
         """Input schema for the MCP tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "report_type": {
-                    "type": "string",
-                    "enum": ["overview", "trends", "patterns", "health", "detailed"],
-                    "description": "Type of statistics report to generate",
-                    "default": "overview"
-                },
-                "time_range": {
-                    "type": "string",
-                    "enum": ["1h", "6h", "24h", "7d", "30d", "all"],
-                    "description": "Time range for statistics",
-                    "default": "24h"
-                },
-                "grouping": {
-                    "type": "string",
-                    "enum": ["hour", "day", "week", "month"],
-                    "description": "Time grouping for trend analysis",
-                    "default": "hour"
-                },
-                "include_predictions": {
-                    "type": "boolean",
-                    "description": "Include trend predictions and forecasts",
-                    "default": false
-                },
-                "include_recommendations": {
-                    "type": "boolean",
-                    "description": "Include actionable recommendations",
-                    "default": true
-                }
-            }
-        }
+        return _INPUT_SCHEMA
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the error statistics tool."""
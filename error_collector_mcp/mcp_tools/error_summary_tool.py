@@ -8,6 +8,59 @@ from ..services import ErrorManager
 from ..storage import SummaryFilters
 
 
+# Built once at import and shared by every tool instance
+_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": ["get_existing", "generate_new", "get_for_error", "list_recent"],
+            "description": "Action to perform",
+            "default": "list_recent"
+        },
+        "error_ids": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of error IDs to summarize (for generate_new or get_for_error)"
+        },
+        "summary_id": {
+            "type": "string",
+            "description": "Specific summary ID to retrieve (for get_existing)"
+        },
+        "time_range": {
+            "type": "string",
+            "enum": ["1h", "6h", "24h", "7d", "30d", "all"],
+            "description": "Time range for recent summaries",
+            "default": "24h"
+        },
+        "min_confidence": {
+            "type": "number",
+            "minimum": 0.0,
+            "maximum": 1.0,
+            "description": "Minimum confidence score for summaries"
+        },
+        "limit": {
+            "type": "integer",
+            "minimum": 1,
+            "maximum": 50,
+            "description": "Maximum number of summaries to return",
+            "default": 10
+        },
+        "include_solutions": {
+            "type": "boolean",
+            "description": "Include detailed solution suggestions",
+            "default": True
+        },
+        "enhance_solutions": {
+            "type": "boolean",
+            "description": "Generate additional solution suggestions",
+            "default": False
+        }
+    },
+    "required": []
+}
+
+
 class ErrorSummaryTool:
     """MCP tool for getting and generating AI-powered error summaries."""
     
@@ -27,56 +80,7 @@ class ErrorSummaryTool:
     @property
     def input_schema(self) -> Dict[str, Any]:
         """Input schema for the MCP tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["get_existing", "generate_new", "get_for_error", "list_recent"],
-                    "description": "Action to perform",
-                    "default": "list_recent"
-                },
-                "error_ids": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of error IDs to summarize (for generate_new or get_for_error)"
-                },
-                "summary_id": {
-                    "type": "string",
-                    "description": "Specific summary ID to retrieve (for get_existing)"
-                },
-                "time_range": {
-                    "type": "string",
-                    "enum": ["1h", "6h", "24h", "7d", "30d", "all"],
-                    "description": "Time range for recent summaries",
-                    "default": "24h"
-                },
-                "min_confidence": {
-                    "type": "number",
-                    "minimum": 0.0,
-                    "maximum": 1.0,
-                    "description": "Minimum confidence score for summaries"
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 50,
-                    "description": "Maximum number of summaries to return",
-                    "default": 10
-                },
-                "include_solutions": {
-                    "type": "boolean",
-                    "description": "Include detailed solution suggestions",
-                    "default": true
-                },
-                "enhance_solutions": {
-                    "type": "boolean",
-                    "description": "Generate additional solution suggestions",
-                    "default": false
-                }
-            },
-            "required": []
-        }
+        return _INPUT_SCHEMA
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the error summary tool."""
@@ -1,5 +1,6 @@
 """Base error model and enums."""
 
+import re
 import uuid
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -33,6 +34,32 @@ class ErrorCategory(str, Enum):
     UNKNOWN = "unknown"
 
 
+def _keywords(*keywords: str) -> "re.Pattern[str]":
+    """Compile lowercase literal keywords into one alternation."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Matched against the lowercased message: IGNORECASE disables the regex
+# engine's literal-prefix search and is several times slower.
+# Checked in order; the first matching category wins
+_CATEGORY_KEYWORDS = (
+    # Syntax errors
+    (ErrorCategory.SYNTAX, _keywords("syntax error", "syntaxerror", "unexpected token", "parse error")),
+    # Network errors
+    (ErrorCategory.NETWORK, _keywords("network", "fetch", "cors", "connection", "timeout", "404", "500")),
+    # Permission errors
+    (ErrorCategory.PERMISSION, _keywords("permission", "access denied", "unauthorized", "forbidden")),
+    # Resource errors
+    (ErrorCategory.RESOURCE, _keywords("out of memory", "disk space", "resource", "quota")),
+    # Runtime errors (default for many JS errors)
+    (ErrorCategory.RUNTIME, _keywords("runtime", "reference", "type", "null", "undefined")),
+)
+
+_CRITICAL_KEYWORDS = _keywords("critical", "fatal", "crash", "segmentation fault", "out of memory")
+_HIGH_KEYWORDS = _keywords("error", "exception", "failed", "cannot", "unable")
+_LOW_KEYWORDS = _keywords("warning", "deprecated", "notice")
+
+
 @dataclass
 class BaseError:
     """Base error model with common fields."""
@@ -61,60 +88,27 @@ class BaseError:
     
     def _auto_categorize(self) -> ErrorCategory:
         """Automatically categorize error based on message content."""
-        message_lower = self.message.lower()
-        
-        # Syntax errors
-        if any(keyword in message_lower for keyword in [
-            "syntax error", "syntaxerror", "unexpected token", "parse error"
-        ]):
-            return ErrorCategory.SYNTAX
-        
-        # Network errors
-        if any(keyword in message_lower for keyword in [
-            "network", "fetch", "cors", "connection", "timeout", "404", "500"
-        ]):
-            return ErrorCategory.NETWORK
-        
-        # Permission errors
-        if any(keyword in message_lower for keyword in [
-            "permission", "access denied", "unauthorized", "forbidden"
-        ]):
-            return ErrorCategory.PERMISSION
-        
-        # Resource errors
-        if any(keyword in message_lower for keyword in [
-            "out of memory", "disk space", "resource", "quota"
-        ]):
-            return ErrorCategory.RESOURCE
-        
-        # Runtime errors (default for many JS errors)
-        if any(keyword in message_lower for keyword in [
-            "runtime", "reference", "type", "null", "undefined"
-        ]):
-            return ErrorCategory.RUNTIME
+        message = self.message.lower()
+        for category, keywords_re in _CATEGORY_KEYWORDS:
+            if keywords_re.search(message):
+                return category
         
         return ErrorCategory.UNKNOWN
     
     def _auto_determine_severity(self) -> ErrorSeverity:
         """Automatically determine severity based on category and content."""
-        message_lower = self.message.lower()
+        message = self.message.lower()
         
         # Critical indicators
-        if any(keyword in message_lower for keyword in [
-            "critical", "fatal", "crash", "segmentation fault", "out of memory"
-        ]):
+        if _CRITICAL_KEYWORDS.search(message):
             return ErrorSeverity.CRITICAL
         
         # High severity indicators
-        if any(keyword in message_lower for keyword in [
-            "error", "exception", "failed", "cannot", "unable"
-        ]) or self.category in [ErrorCategory.SYNTAX, ErrorCategory.PERMISSION]:
+        if _HIGH_KEYWORDS.search(message) or self.category in [ErrorCategory.SYNTAX, ErrorCategory.PERMISSION]:
             return ErrorSeverity.HIGH
         
         # Low severity indicators
-        if any(keyword in message_lower for keyword in [
-            "warning", "deprecated", "notice"
-        ]):
+        if _LOW_KEYWORDS.search(message):
             return ErrorSeverity.LOW
         
         return ErrorSeverity.MEDIUM
@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional
 
 from fastmcp import FastMCP
 
+from . import install_fast_loop
 from .services import ErrorCollectorMCPService
 from .mcp_tools import ErrorQueryTool, ErrorSummaryTool, ErrorStatisticsTool
 
@@ -383,6 +384,9 @@ def main():
     
     logger.info("Starting Error Collector MCP server...")
     
+    # Use uvloop when installed
+    install_fast_loop()
+    
     # Run the FastMCP server
     app.run()
 
@@ -5,7 +5,7 @@ import os
 import re
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Pattern, Tuple
 
 from ..config import Config, OpenRouterConfig, CollectionPreferences
 from ..config.config_validator import ConfigValidator
@@ -14,12 +14,51 @@ from ..config.config_validator import ConfigValidator
 logger = logging.getLogger(__name__)
 
 
+def _compile_ignored_domains(domains: List[str]) -> Optional[Pattern[str]]:
+    """Combine ignored domain substrings into one literal alternation."""
+    if not domains:
+        return None
+    return re.compile("|".join(re.escape(domain) for domain in domains))
+
+
+def _compile_ignored_patterns(patterns: List[str]) -> Tuple[Pattern[str], ...]:
+    """Compile ignored message patterns, combining what can share one regex.
+    
+    Invalid patterns are skipped with one warning. Patterns with capture
+    groups (backreferences would be renumbered) or inline flags (which would
+    leak into the other alternatives) are kept as separately compiled regexes.
+    """
+    base_flags = re.compile("", re.IGNORECASE).flags
+    combinable = []
+    separate = []
+    for pattern in patterns:
+        regex, _ = ConfigValidator.compile_pattern(pattern, re.IGNORECASE)
+        if regex is None:
+            logger.warning(f"Invalid regex pattern ignored: {pattern}")
+            continue
+        if regex.groups == 0 and regex.flags == base_flags:
+            combinable.append(regex)
+        else:
+            separate.append(regex)
+    
+    if len(combinable) > 1:
+        combined, _ = ConfigValidator.compile_pattern(
+            "|".join(f"(?:{regex.pattern})" for regex in combinable), re.IGNORECASE
+        )
+        if combined is not None:
+            combinable = [combined]
+    return tuple(combinable + separate)
+
+
 class ConfigService:
     """Service for loading, validating, and managing configuration."""
     
     def __init__(self):
         self._config: Optional[Config] = None
         self._config_path: Optional[str] = None
+        # Ignore matchers compiled for the preferences object they came from
+        self._ignore_matchers_source: Optional[CollectionPreferences] = None
+        self._ignore_matchers: Tuple[Optional[Pattern[str]], Tuple[Pattern[str], ...]] = (None, ())
     
     async def load_config(self, config_path: str) -> Config:
         """Load configuration from file with validation."""
@@ -64,7 +103,7 @@ class ConfigService:
             config_data = self._apply_env_overrides(config_data)
             
             # Create Config object with Pydantic validation
-            config = Config(**config_data)
+            config = Config.model_validate(config_data)
             
             logger.debug("Configuration parsed successfully")
             return config
@@ -243,23 +282,26 @@ class ConfigService:
     
     def should_ignore_error(self, error_message: str, domain: Optional[str] = None) -> bool:
         """Check if an error should be ignored based on preferences."""
-        prefs = self.get_collection_preferences()
+        domains_re, patterns = self._get_ignore_matchers()
         
         # Check ignored domains (for browser errors)
-        if domain and any(ignored in domain for ignored in prefs.ignored_domains):
+        if domain and domains_re is not None and domains_re.search(domain):
             return True
         
         # Check ignored error patterns
-        import re
-        for pattern in prefs.ignored_error_patterns:
-            try:
-                if re.search(pattern, error_message, re.IGNORECASE):
-                    return True
-            except re.error:
-                logger.warning(f"Invalid regex pattern ignored: {pattern}")
-                continue
-        
-        return False
+        return any(pattern.search(error_message) for pattern in patterns)
+    
+    def _get_ignore_matchers(self) -> Tuple[Optional[Pattern[str]], Tuple[Pattern[str], ...]]:
+        """Return compiled ignore matchers, rebuilding them when preferences change."""
+        prefs = self.get_collection_preferences()
+        # Config models are frozen, so identity tells us when to recompile
+        if prefs is not self._ignore_matchers_source:
+            self._ignore_matchers = (
+                _compile_ignored_domains(prefs.ignored_domains),
+                _compile_ignored_patterns(prefs.ignored_error_patterns)
+            )
+            self._ignore_matchers_source = prefs
+        return self._ignore_matchers
     
     def get_data_directory(self) -> Path:
         """Get the configured data directory as a Path object."""
@@ -270,7 +312,7 @@ class ConfigService:
         if self._config is None:
             raise RuntimeError("No configuration loaded")
         
-        config_dict = self._config.dict()
+        config_dict = self._config.model_dump()
         
         # Mask sensitive information
         if 'openrouter' in config_dict and 'api_key' in config_dict['openrouter']:
@@ -79,12 +79,13 @@ class ErrorManager:
         
         self._is_running = True
         
-        # Start storage components
-        await self.error_store.initialize()
-        await self.summary_store.initialize()
-        
-        # Start AI summarizer
-        await self.ai_summarizer.start()
+        # Storage and the AI summarizer don't depend on each other, so start
+        # them together
+        await asyncio.gather(
+            self.error_store.initialize(),
+            self.summary_store.initialize(),
+            self.ai_summarizer.start()
+        )
         
         # Start background processing tasks
         self._start_background_tasks()
@@ -145,11 +145,13 @@ class ErrorCollectorMCPService:
             
             # Get collector status
             collector_status = {}
+            collectors_active = 0
             for name, collector in self.error_manager.collectors.items():
                 collector_status[name] = {
                     "collecting": collector.is_collecting,
                     "healthy": await collector.health_check()
                 }
+                collectors_active += collector.is_collecting
             
             return {
                 "status": "running",
@@ -157,6 +159,7 @@ class ErrorCollectorMCPService:
                 "statistics": stats,
                 "health": health,
                 "collectors": collector_status,
+                "collectors_active": collectors_active,
                 "data_directory": str(self.data_directory),
                 "config_path": self.config_path
             }
@@ -165,6 +168,30 @@ class ErrorCollectorMCPService:
             logger.error(f"Failed to get service status: {e}")
             return {"status": "error", "error": str(e)}
     
+    async def get_service_status_summary(self) -> dict:
+        """Get service status, health and active collector count only.
+        
+        Skips the statistics and per-collector details gathered by
+        get_service_status().
+        """
+        if not self._is_running or not self.error_manager:
+            return {"status": "stopped"}
+        
+        try:
+            health = await self.error_manager.health_check()
+            
+            return {
+                "status": "running",
+                "healthy": health["overall"],
+                "collectors_active": sum(
+                    collector.is_collecting for collector in self.error_manager.collectors.values()
+                )
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get service status: {e}")
+            return {"status": "error", "error": str(e)}
+    
     async def simulate_browser_error(self) -> str:
         """Simulate a browser error for testing."""
         if not self._is_running or not self.error_manager:
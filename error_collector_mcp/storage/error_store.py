@@ -15,6 +15,12 @@ from ..models import BaseError, BrowserError, TerminalError, ErrorSource, ErrorC
 logger = logging.getLogger(__name__)
 
 
+def _read_json(path: Path) -> Dict[str, Any]:
+    """Read and parse a JSON file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class ErrorFilters:
     """Filters for error retrieval."""
     
@@ -269,8 +275,8 @@ class ErrorStore:
             if not errors_file.exists():
                 return
             
-            with open(errors_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read and parse off the event loop so stores can load concurrently
+            data = await asyncio.to_thread(_read_json, errors_file)
             
             loaded_count = 0
             for error_data in data.get("errors", []):
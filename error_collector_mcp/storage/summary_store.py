@@ -13,6 +13,12 @@ from ..models import ErrorSummary
 logger = logging.getLogger(__name__)
 
 
+def _read_json(path: Path) -> Dict[str, Any]:
+    """Read and parse a JSON file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class SummaryFilters:
     """Filters for summary retrieval."""
     
@@ -256,8 +262,8 @@ class SummaryStore:
             if not summaries_file.exists():
                 return
             
-            with open(summaries_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read and parse off the event loop so stores can load concurrently
+            data = await asyncio.to_thread(_read_json, summaries_file)
             
             loaded_count = 0
             for summary_data in data.get("summaries", []):
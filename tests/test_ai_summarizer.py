@@ -443,15 +443,15 @@ class TestAISummarizer:
             await ai_summarizer.start()
             
             try:
-                # Reduce timeout for testing
-                original_timeout = ai_summarizer.config.timeout
-                ai_summarizer.config.timeout = 0.1
+                # Reduce timeout for testing (config models are frozen)
+                original_config = ai_summarizer.config
+                ai_summarizer.config = original_config.model_copy(update={"timeout": 0.1})
                 
                 with pytest.raises(Exception):  # Should timeout
                     await ai_summarizer.summarize_error(sample_errors[0])
                 
                 # Restore timeout
-                ai_summarizer.config.timeout = original_timeout
+                ai_summarizer.config = original_config
                 
             finally:
                 await ai_summarizer.stop()
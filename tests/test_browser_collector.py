@@ -4,6 +4,7 @@ import pytest
 import asyncio
 import json
 import tempfile
+import zipfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
 import aiohttp
@@ -112,6 +113,39 @@ class TestBrowserConsoleCollector:
         errors = await browser_collector.get_collected_errors()
         assert len(errors) == 1  # Should be collected
     
+    @pytest.mark.asyncio
+    async def test_duplicate_errors_suppressed(self, browser_collector, sample_error_data):
+        """Test repeated identical errors are collected only once per window."""
+        await browser_collector.start_collection()
+        
+        for _ in range(5):
+            await browser_collector._process_browser_error_data(sample_error_data)
+        
+        errors = await browser_collector.get_collected_errors()
+        assert len(errors) == 1
+        assert browser_collector._duplicates_suppressed == 4
+        
+        # A different location is not a duplicate
+        await browser_collector._process_browser_error_data({**sample_error_data, "line_number": 43})
+        errors = await browser_collector.get_collected_errors()
+        assert len(errors) == 1
+    
+    @pytest.mark.asyncio
+    async def test_process_raw_error(self, browser_collector, sample_error_data):
+        """Test raw JSON payloads are decoded and processed."""
+        await browser_collector.start_collection()
+        
+        await browser_collector._process_raw_error(json.dumps(sample_error_data).encode())
+        # Off-schema payloads still go through the lenient path
+        await browser_collector._process_raw_error(json.dumps({**sample_error_data, "line_number": "7"}))
+        
+        errors = await browser_collector.get_collected_errors()
+        assert len(errors) == 2
+        assert errors[0].message == sample_error_data["message"]
+        
+        with pytest.raises(ValueError):
+            await browser_collector._process_raw_error(b"{not json")
+    
     @pytest.mark.asyncio
     async def test_error_severity_determination(self, browser_collector):
         """Test error severity determination."""
@@ -147,6 +181,7 @@ class TestBrowserConsoleCollector:
         
         # Process an error
         await browser_collector._process_browser_error_data(sample_error_data)
+        await browser_collector._error_queue.join()
         
         # Should have called the callback
         assert len(callback_errors) == 1
@@ -155,10 +190,43 @@ class TestBrowserConsoleCollector:
         # Remove callback and test
         browser_collector.remove_error_callback(error_callback)
         await browser_collector._process_browser_error_data(sample_error_data)
+        await browser_collector._error_queue.join()
         
         # Should not have added another error to callback list
         assert len(callback_errors) == 1
     
+    @pytest.mark.asyncio
+    async def test_async_error_callbacks(self, browser_collector, sample_error_data):
+        """Test coroutine callbacks are awaited."""
+        received = asyncio.Event()
+        
+        async def error_callback(error: BrowserError):
+            received.set()
+        
+        browser_collector.add_error_callback(error_callback)
+        await browser_collector.start_collection()
+        
+        await browser_collector._process_browser_error_data(sample_error_data)
+        await asyncio.wait_for(received.wait(), timeout=1.0)
+    
+    @pytest.mark.asyncio
+    async def test_errors_broadcast_to_clients(self, browser_collector, sample_error_data):
+        """Test queued errors are pushed to connected WebSocket clients."""
+        client = MagicMock()
+        client.send = AsyncMock()
+        failing_client = MagicMock()
+        failing_client.send = AsyncMock(side_effect=Exception("connection closed"))
+        
+        await browser_collector.start_collection()
+        browser_collector._connected_clients.update({client, failing_client})
+        
+        await browser_collector._process_browser_error_data(sample_error_data)
+        await browser_collector._error_queue.join()
+        
+        client.send.assert_awaited_once()
+        payload = json.loads(client.send.await_args.args[0])
+        assert payload[0]["message"] == sample_error_data["message"]
+    
     def test_bookmarklet_generation(self, browser_collector):
         """Test bookmarklet code generation."""
         bookmarklet = browser_collector.get_bookmarklet_code()
@@ -237,6 +305,40 @@ class TestBrowserConsoleCollector:
             # Cleanup
             log_file_path.unlink(missing_ok=True)
     
+    @pytest.mark.asyncio
+    async def test_log_file_monitoring_skips_own_writes(self, browser_collector, sample_error_data):
+        """Test the monitor does not re-collect errors this collector logged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file_path = Path(temp_dir) / "browser_errors.log"
+            browser_collector._log_file = log_file_path
+            
+            await browser_collector.start_collection()
+            try:
+                await browser_collector._process_browser_error_data(sample_error_data)
+                
+                # Long enough for the delayed flush and the monitor pass it wakes
+                await asyncio.sleep(browser_collector._log_flush_interval + 1.0)
+                
+                errors = await browser_collector.get_collected_errors()
+                assert len(errors) == 1
+                assert len(log_file_path.read_bytes().splitlines()) == 1
+            finally:
+                await browser_collector.stop_collection()
+    
+    @pytest.mark.asyncio
+    async def test_log_file_written_on_stop(self, browser_collector, sample_error_data):
+        """Test buffered log writes are flushed when collection stops."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            browser_collector._log_file = Path(temp_dir) / "browser_errors.log"
+            
+            await browser_collector.start_collection()
+            await browser_collector._process_browser_error_data(sample_error_data)
+            await browser_collector.stop_collection()
+            
+            lines = browser_collector._log_file.read_text().splitlines()
+            assert len(lines) == 1
+            assert json.loads(lines[0])["message"] == sample_error_data["message"]
+    
     @pytest.mark.asyncio
     async def test_http_server_error_collection(self, browser_collector, sample_error_data):
         """Test HTTP server error collection endpoint."""
@@ -291,6 +393,31 @@ class TestBrowserConsoleCollector:
             # Server might not be fully started, skip this test
             pytest.skip("HTTP server not accessible")
 
+    
+    @pytest.mark.asyncio
+    async def test_static_endpoint_etag(self, browser_collector):
+        """Test static endpoints send an ETag and honour If-None-Match."""
+        await browser_collector.start_collection()
+        
+        # Give server time to start
+        await asyncio.sleep(0.1)
+        
+        try:
+            url = f'http://localhost:{browser_collector._http_port}/extension/manifest.json'
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url) as response:
+                    assert response.status == 200
+                    etag = response.headers["ETag"]
+                    manifest = await response.json()
+                    assert manifest["manifest_version"] == 3
+                
+                async with session.get(url, headers={"If-None-Match": etag}) as response:
+                    assert response.status == 304
+                    
+        except aiohttp.ClientConnectorError:
+            # Server might not be fully started, skip this test
+            pytest.skip("HTTP server not accessible")
+
 
 class TestBrowserExtensionBuilder:
     """Test BrowserExtensionBuilder functionality."""
@@ -313,7 +440,7 @@ class TestBrowserExtensionBuilder:
             assert (result_dir / "background.js").exists()
             assert (result_dir / "popup.html").exists()
             assert (result_dir / "popup.js").exists()
-            assert (result_dir / "icons" / "icon.svg").exists()
+            assert (result_dir / "icon.svg").exists()
             
             # Check manifest content
             with open(result_dir / "manifest.json") as f:
@@ -356,6 +483,56 @@ class TestBrowserExtensionBuilder:
             assert result_file.exists()
             assert result_file.suffix == ".zip"
             assert result_file.stat().st_size > 0
+            
+            # Faster level still produces a valid archive
+            fast_file = extension_builder.create_extension_package(
+                extension_dir, Path(temp_dir) / "extension-fast.zip", compress_level=1
+            )
+            with zipfile.ZipFile(fast_file) as zf:
+                assert "manifest.json" in zf.namelist()
+                assert zf.testzip() is None
+
+    def test_in_memory_packaging(self, extension_builder):
+        """Test packaging directly from generated files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            extension_dir = extension_builder.build_chrome_extension(Path(temp_dir) / "chrome")
+            package_file = extension_builder.package_chrome_extension(Path(temp_dir) / "chrome.zip")
+            
+            # Archive matches the unpacked build file for file
+            with zipfile.ZipFile(package_file) as zf:
+                assert "icon.svg" in zf.namelist()
+                for name in zf.namelist():
+                    assert zf.read(name) == (extension_dir / name).read_bytes()
+            
+            firefox_file = extension_builder.package_firefox_extension(Path(temp_dir) / "firefox.zip")
+            with zipfile.ZipFile(firefox_file) as zf:
+                assert "browser." in zf.read("content.js").decode()
+    
+    def test_build_extensions(self, extension_builder):
+        """Test building and packaging several browsers at once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            
+            messages = extension_builder.build_extensions(["chrome", "firefox"], output_dir, package=True)
+            
+            # Packaging still writes the unpacked directories for "Load unpacked"
+            assert len(messages) == 4
+            assert messages[0].startswith("Chrome")
+            assert (output_dir / "error-collector-mcp-chrome.zip").exists()
+            assert (output_dir / "error-collector-mcp-firefox.zip").exists()
+            assert (output_dir / "chrome" / "manifest.json").exists()
+            assert (output_dir / "firefox" / "manifest.json").exists()
+    
+    def test_build_extensions_package_only(self, extension_builder):
+        """Test packaging without writing the unpacked directories."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            
+            messages = extension_builder.build_extensions(["chrome"], output_dir, package_only=True)
+            
+            assert len(messages) == 1
+            assert (output_dir / "error-collector-mcp-chrome.zip").exists()
+            assert not (output_dir / "chrome").exists()
     
     def test_manifest_generation(self, extension_builder):
         """Test manifest generation for different browsers."""
@@ -371,6 +548,30 @@ class TestBrowserExtensionBuilder:
         assert "scripts" in firefox_manifest["background"]
         assert "browser_action" in firefox_manifest
     
+    def test_pretty_manifest_change_after_build(self, extension_builder):
+        """Test changing pretty_manifest after a build changes the manifest written."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            compact = extension_builder.build_chrome_extension(Path(temp_dir) / "compact")
+            extension_builder.pretty_manifest = True
+            pretty = extension_builder.build_chrome_extension(Path(temp_dir) / "pretty")
+            
+            assert "\n" not in (compact / "manifest.json").read_text()
+            assert "\n" in (pretty / "manifest.json").read_text()
+    
+    def test_manifests_do_not_share_state(self, extension_builder):
+        """Test mutating one manifest leaves other manifests untouched."""
+        manifest = extension_builder._get_manifest_v3()
+        manifest["icons"]["16"] = "changed.svg"
+        manifest["content_scripts"][0]["js"].append("extra.js")
+        
+        for other in (
+            BrowserExtensionBuilder(collector_port=9000)._get_manifest_v3(),
+            extension_builder._get_manifest_v2()
+        ):
+            assert other["icons"]["16"] == "icon.svg"
+            assert other["content_scripts"][0]["js"] == ["content.js"]
+        assert isinstance(manifest["permissions"], list)
+    
     def test_content_script_generation(self, extension_builder):
         """Test content script generation."""
         content_script = extension_builder._get_content_script()
@@ -3,7 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
-from error_collector_mcp.config import Config, OpenRouterConfig, CollectionPreferences
+from error_collector_mcp.config import Config, OpenRouterConfig, CollectionPreferences, ConfigValidator
 
 
 class TestOpenRouterConfig:
@@ -36,6 +36,15 @@ class TestCollectionPreferences:
         assert "terminal" in prefs.enabled_sources
         assert prefs.auto_summarize is True
         assert prefs.group_similar_errors is True
+    
+    def test_invalid_ignore_pattern_reported(self):
+        """Test that invalid ignore patterns are reported, valid ones compiled once."""
+        prefs = CollectionPreferences(ignored_error_patterns=["ok.*", "bad("])
+        issues = ConfigValidator.validate_collection_preferences(prefs)
+        
+        assert len(issues) == 1
+        assert "bad(" in issues[0]
+        assert ConfigValidator.compile_pattern("ok.*")[0] is ConfigValidator.compile_pattern("ok.*")[0]
 
 
 class TestConfig:
@@ -204,6 +204,52 @@ class TestConfigService:
         finally:
             Path(temp_path).unlink(missing_ok=True)
     
+    @pytest.mark.asyncio
+    async def test_should_ignore_error_uncombinable_patterns(self, config_service, valid_config_data):
+        """Test ignore patterns that cannot share one regex still match."""
+        valid_config_data["collection"]["ignored_error_patterns"] = [
+            r"(?s)first.*line",
+            r"Non-Error promise rejection"
+        ]
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(valid_config_data, f)
+            temp_path = f.name
+        
+        try:
+            await config_service.load_config(temp_path)
+            
+            assert config_service.should_ignore_error("first\nline")
+            assert config_service.should_ignore_error("non-error promise rejection")
+            assert not config_service.should_ignore_error("TypeError: Cannot read property")
+        
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    @pytest.mark.asyncio
+    async def test_should_ignore_error_backreference_patterns(self, config_service, valid_config_data):
+        """Test numbered backreferences keep working alongside other patterns."""
+        valid_config_data["collection"]["ignored_error_patterns"] = [
+            r"failed (x)",
+            r"(\w+) \1 repeated",
+            r"Non-Error promise rejection"
+        ]
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(valid_config_data, f)
+            temp_path = f.name
+        
+        try:
+            await config_service.load_config(temp_path)
+            
+            assert config_service.should_ignore_error("boom boom repeated")
+            assert config_service.should_ignore_error("build failed x")
+            assert config_service.should_ignore_error("non-error promise rejection")
+            assert not config_service.should_ignore_error("boom bang repeated")
+        
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
     @pytest.mark.asyncio
     async def test_reload_config(self, config_service, temp_config_file):
         """Test configuration reloading."""
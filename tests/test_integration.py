@@ -113,6 +113,13 @@ class TestCompleteIntegration:
                 assert "statistics" in status
                 assert "collectors" in status
                 
+                # Test status summary
+                summary = await service.get_service_status_summary()
+                assert summary["status"] == "running"
+                assert summary["healthy"] == status["healthy"]
+                assert summary["collectors_active"] == status["collectors_active"]
+                assert "statistics" not in summary
+                
             finally:
                 await service.stop()
     
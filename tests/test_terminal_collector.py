@@ -4,6 +4,7 @@ import pytest
 import asyncio
 import tempfile
 import os
+import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -68,6 +69,19 @@ class TestTerminalCollector:
         assert result.exit_code == -1
         assert "timed out" in result.stderr.lower()
     
+    @pytest.mark.asyncio
+    async def test_large_output_keeps_tail(self, terminal_collector):
+        """Test that only the tail of large command output is kept."""
+        terminal_collector._max_output_bytes = 1000
+        
+        result = await terminal_collector.execute_command("seq 1 10000")
+        
+        assert result.exit_code == 0
+        assert len(result.stdout) <= 1000
+        # Whole lines only, ending with the last one printed
+        lines = result.stdout.splitlines()
+        assert lines == [str(n) for n in range(int(lines[0]), 10001)]
+    
     @pytest.mark.asyncio
     async def test_error_pattern_detection(self, terminal_collector):
         """Test detection of error patterns in output."""
@@ -162,6 +176,8 @@ class TestTerminalCollector:
         
         # Execute a failing command
         await terminal_collector.execute_command("ls /nonexistent")
+        # Callbacks run on the next loop iteration
+        await asyncio.sleep(0)
         
         # Should have called the callback
         assert len(callback_errors) == 1
@@ -170,6 +186,7 @@ class TestTerminalCollector:
         # Remove callback and test
         terminal_collector.remove_error_callback(error_callback)
         await terminal_collector.execute_command("ls /another_nonexistent")
+        await asyncio.sleep(0)
         
         # Should not have added another error to callback list
         assert len(callback_errors) == 1
@@ -218,6 +235,66 @@ class TestTerminalCollector:
             # Cleanup
             os.unlink(log_file_path)
     
+    @staticmethod
+    async def _wait_for_errors(collector, count, timeout=3.0):
+        """Poll until the collector holds at least count errors."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while asyncio.get_running_loop().time() < deadline:
+            errors = await collector.get_collected_errors()
+            if len(errors) >= count:
+                return errors
+            await asyncio.sleep(0.05)
+        return await collector.get_collected_errors()
+    
+    @pytest.mark.asyncio
+    async def test_monitor_command_file_relative_path(self, terminal_collector, tmp_path, monkeypatch):
+        """Test monitoring a log file given by a relative path."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "errors.log").write_text("Initial content\n")
+        
+        await terminal_collector.start_collection()
+        monitor_task = asyncio.create_task(
+            terminal_collector.monitor_command_file("errors.log")
+        )
+        
+        try:
+            await asyncio.sleep(0.1)
+            with open(tmp_path / "errors.log", 'a') as f:
+                f.write("error: something went wrong\n")
+            
+            errors = await self._wait_for_errors(terminal_collector, 1)
+            assert len(errors) >= 1
+        finally:
+            monitor_task.cancel()
+            await terminal_collector.stop_collection()
+    
+    @pytest.mark.asyncio
+    async def test_monitor_command_file_rotation(self, terminal_collector, tmp_path):
+        """Test that monitoring follows a log file replaced by rotation."""
+        log_path = tmp_path / "commands.log"
+        log_path.write_text("Initial content\n")
+        
+        await terminal_collector.start_collection()
+        monitor_task = asyncio.create_task(
+            terminal_collector.monitor_command_file(str(log_path))
+        )
+        
+        try:
+            await asyncio.sleep(0.1)
+            
+            # Rename the old file away and start a fresh one in its place
+            log_path.rename(tmp_path / "commands.log.1")
+            log_path.write_text("")
+            await asyncio.sleep(0.1)
+            with open(log_path, 'a') as f:
+                f.write("error: build failed after rotation\n")
+            
+            errors = await self._wait_for_errors(terminal_collector, 1)
+            assert len(errors) >= 1
+        finally:
+            monitor_task.cancel()
+            await terminal_collector.stop_collection()
+    
     @pytest.mark.asyncio
     async def test_working_directory_handling(self, terminal_collector):
         """Test handling of working directory in commands."""
@@ -283,7 +360,7 @@ class TestShellWrapper:
             log_content = temp_log.read()
             assert "test command" in log_content
             assert "error: something went wrong" in log_content
-            assert '"exit_code": 1' in log_content
+            assert json.loads(log_content)["exit_code"] == 1
         
         # Cleanup
         os.unlink(temp_log.name)
@@ -308,6 +385,24 @@ class TestShellWrapper:
         
         # Cleanup
         os.unlink(temp_log.name)
+
+    def test_batched_log_writes(self):
+        """Test records are buffered until flush_every is reached."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            shell_wrapper = ShellWrapper(flush_every=3)
+            shell_wrapper.log_file = Path(temp_dir) / "errors.log"
+            
+            for i in range(2):
+                shell_wrapper.wrap_command(f"cmd {i}", 1, "error: boom", "")
+            assert shell_wrapper.log_file.read_text() == ""
+            
+            # Third record reaches the batch size
+            shell_wrapper.wrap_command("cmd 2", 1, "error: boom", "")
+            assert len(shell_wrapper.log_file.read_text().splitlines()) == 3
+            
+            shell_wrapper.wrap_command("cmd 3", 1, "error: boom", "")
+            shell_wrapper.close()
+            assert len(shell_wrapper.log_file.read_text().splitlines()) == 4
     
     def test_bash_integration_generation(self, shell_wrapper):
         """Test bash integration script generation."""